@@ -0,0 +1,83 @@
+"""
+Throughput benchmark: single worker vs. multiple workers.
+
+Starts serve.py once per worker count, hammers a read endpoint from a pool of
+client threads for a fixed duration, and prints requests/second for each run.
+
+    python bench_workers.py --workers 1 --workers 4 --path /api/products?featured=true
+"""
+
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+import requests
+import typer
+
+ROOT_DIR = Path(__file__).parent
+
+cli = typer.Typer(add_completion=False)
+
+
+def wait_until_ready(url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url, timeout=1).status_code < 500:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server did not become ready at {url}")
+
+
+def hammer(url: str, deadline: float) -> int:
+    session = requests.Session()
+    done = 0
+    while time.monotonic() < deadline:
+        session.get(url).raise_for_status()
+        done += 1
+    return done
+
+
+def run_once(workers: int, port: int, path: str, concurrency: int, duration: float) -> float:
+    url = f"http://127.0.0.1:{port}{path}"
+    proc = subprocess.Popen(
+        [sys.executable, str(ROOT_DIR / "serve.py"), "--port", str(port), "--workers", str(workers)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(url)
+        deadline = time.monotonic() + duration
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            total = sum(pool.map(lambda _: hammer(url, deadline), range(concurrency)))
+        return total / duration
+    finally:
+        proc.terminate()
+        proc.wait(timeout=60)
+
+
+@cli.command()
+def main(
+    workers: List[int] = typer.Option([1, 4], help="Worker counts to compare"),
+    port: int = typer.Option(8101, help="Port for the benchmark server"),
+    path: str = typer.Option("/api/products?featured=true", help="Endpoint to request"),
+    concurrency: int = typer.Option(32, help="Concurrent client threads"),
+    duration: float = typer.Option(10.0, help="Seconds per run"),
+):
+    results = {}
+    for count in workers:
+        results[count] = run_once(count, port, path, concurrency, duration)
+        print(f"{count} worker(s): {results[count]:.1f} req/s")
+
+    baseline = results[workers[0]]
+    for count, rps in results.items():
+        print(f"  {count} worker(s): {rps / baseline:.2f}x vs {workers[0]} worker(s)")
+
+
+if __name__ == "__main__":
+    cli()
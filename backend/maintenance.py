@@ -0,0 +1,128 @@
+"""
+Database maintenance shared by the API server and the command-line tools.
+
+Everything here takes the database handle as an argument, so scripts such as
+snapshot.py can run it against their own client without importing the app.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+CATALOG_COLLECTIONS = ("products", "services", "gallery", "reviews")
+
+# Products, services and gallery items are soft-deleted: the document stays
+# behind as a tombstone (deleted=True) so delta sync and the per-worker caches
+# see the deletion, and the compactor purges it once it has expired.
+SOFT_DELETE_COLLECTIONS = ("products", "services", "gallery")
+LIVE = {"deleted": False}
+
+# Approved-review rating aggregates live in a single document that is kept up
+# to date with $inc on every create/approve, so reading it never scans reviews.
+REVIEW_SUMMARY_ID = "reviews"
+RATING_VALUES = range(1, 6)
+REBUILD_ATTEMPTS = 20
+REBUILD_BACKOFF_SECONDS = 0.05
+# A writer that has not finished by now is assumed to have died mid-write
+SUMMARY_WRITER_TIMEOUT = timedelta(seconds=30)
+
+
+@asynccontextmanager
+async def review_summary_write(db):
+    """Wrap a review write and the summary change it causes.
+
+    The writer is registered on the summary document (bumping its version)
+    before the review is touched, and the $inc is applied together with the
+    deregistration afterwards. Append (rating, delta) pairs to the yielded
+    list for the block's effect on the approved reviews.
+    """
+    token = ObjectId()
+    await db.review_summary.update_one(
+        {"_id": REVIEW_SUMMARY_ID},
+        {"$push": {"writers": {"token": token, "at": datetime.utcnow()}}, "$inc": {"version": 1}},
+        upsert=True
+    )
+    changes = []
+    try:
+        yield changes
+    finally:
+        inc = {"version": 1}
+        for rating, delta in changes:
+            inc["count"] = inc.get("count", 0) + delta
+            inc["sum"] = inc.get("sum", 0) + delta * rating
+            inc[f"histogram.{rating}"] = inc.get(f"histogram.{rating}", 0) + delta
+        await db.review_summary.update_one(
+            {"_id": REVIEW_SUMMARY_ID},
+            {"$inc": inc, "$pull": {"writers": {"token": token}}}
+        )
+
+
+async def rebuild_review_summary(db):
+    """Recompute the rating summary from the approved reviews.
+
+    Writers bump the version when they start and again when their $inc lands
+    (see review_summary_write). The rebuild waits until no writer is between
+    the two, and its result is only written if the version is unchanged since
+    before the aggregate. A review the aggregate sees is therefore never
+    counted again by a later $inc, and an increment that lands mid-rebuild is
+    never overwritten; the rebuild just runs again.
+    """
+    pipeline = [
+        {"$match": {"approved": True}},
+        {"$group": {"_id": "$rating", "n": {"$sum": 1}}}
+    ]
+    for attempt in range(REBUILD_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(REBUILD_BACKOFF_SECONDS)
+        current = await db.review_summary.find_one({"_id": REVIEW_SUMMARY_ID}, {"version": 1, "writers": 1})
+        stale = datetime.utcnow() - SUMMARY_WRITER_TIMEOUT
+        if current and any(w['at'] > stale for w in current.get('writers', [])):
+            continue
+        if current and 'version' in current:
+            version = current['version']
+            guard = {"_id": REVIEW_SUMMARY_ID, "version": version}
+        else:
+            version = 0
+            guard = {"_id": REVIEW_SUMMARY_ID, "version": {"$exists": False}}
+
+        histogram = {str(r): 0 for r in RATING_VALUES}
+        async for row in db.reviews.aggregate(pipeline):
+            if row['_id'] in RATING_VALUES:
+                histogram[str(row['_id'])] = row['n']
+        summary = {
+            "count": sum(histogram.values()),
+            "sum": sum(int(r) * n for r, n in histogram.items()),
+            "histogram": histogram,
+            "version": version
+        }
+        try:
+            result = await db.review_summary.replace_one(guard, summary, upsert=True)
+        except DuplicateKeyError:
+            continue  # an $inc created or bumped the document meanwhile
+        if result.matched_count or result.upserted_id is not None:
+            return summary
+    raise RuntimeError("Reviews kept changing while rebuilding the summary")
+
+
+async def create_indexes(db):
+    for collection in CATALOG_COLLECTIONS:
+        await db[collection].create_index("updatedAt")
+    for collection in SOFT_DELETE_COLLECTIONS:
+        await db[collection].create_index("deletedAt", partialFilterExpression={"deleted": True})
+    # List endpoints only ever read live documents. The unfiltered product
+    # and service lists match {"deleted": False} alone, which a partial index
+    # on deleted serves without touching tombstones.
+    for collection in ("products", "services"):
+        await db[collection].create_index("deleted", partialFilterExpression=LIVE)
+    await db.products.create_index([("category", 1), ("featured", 1)], partialFilterExpression=LIVE)
+    await db.gallery.create_index([("createdAt", -1)], partialFilterExpression=LIVE)
+    await db.bookings.create_index([("appointmentAt", 1), ("status", 1)])
+
+
+async def backfill_deleted_flags(db):
+    """Mark documents written before soft-delete existed as live"""
+    for collection in SOFT_DELETE_COLLECTIONS:
+        await db[collection].update_many({"deleted": {"$exists": False}}, {"$set": LIVE})
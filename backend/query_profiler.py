@@ -0,0 +1,229 @@
+"""
+Always-on MongoDB query profiler built on pymongo's command monitoring.
+
+Every command is reduced to a shape: the command name, the collection and the
+filter/sort/pipeline structure with literal values replaced by ``?``. Each
+shape keeps a fixed-size window of recent latencies for percentiles and the
+duration and time of the last few slow executions. The first slow execution
+of a shape (and then at most one every ``EXPLAIN_INTERVAL_SECONDS``) is
+explained in the background so the plan can be read next to the numbers.
+
+Commands carry customer data (names, phones, emails in bookings), so nothing
+that is kept holds literal values: samples have no command text and the
+value-bearing parts of a plan are normalized like the shape.
+
+Memory is bounded: at most ``MAX_SHAPES`` shapes are tracked, least recently
+seen first out, each with ``WINDOW`` latencies and ``SLOW_SAMPLES`` samples.
+Listener callbacks run on Motor's executor threads, so state is guarded by a
+lock and explains are handed back to the event loop.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pymongo import monitoring
+
+MAX_SHAPES = 200
+WINDOW = 512
+SLOW_SAMPLES = 5
+EXPLAIN_INTERVAL_SECONDS = 600
+
+# Commands that carry a filter we can normalize, and where it lives
+FILTER_FIELDS = {
+    "find": ("filter", "sort", "projection"),
+    "count": ("query",),
+    "distinct": ("query",),
+    "findAndModify": ("query", "sort"),
+}
+EXPLAINABLE = {"find", "aggregate", "count", "distinct", "findAndModify", "update", "delete"}
+# Driver bookkeeping that is not part of the query and cannot be explained
+DRIVER_FIELDS = {"lsid", "txnNumber", "$db", "$clusterTime", "$readPreference", "$readConcern"}
+# Plan fields that embed the query's literal values
+PLAN_VALUE_FIELDS = {"filter", "parsedQuery", "indexBounds"}
+IGNORED = {"explain", "ping", "hello", "isMaster", "ismaster", "endSessions", "getMore", "killCursors", "saslStart", "saslContinue"}
+
+
+def normalize(value):
+    """Replace literal values with '?', keeping field names and operators"""
+    if isinstance(value, dict):
+        return {k: normalize(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        shapes = []
+        for item in value:
+            shape = normalize(item)
+            if shape not in shapes:
+                shapes.append(shape)
+        return shapes
+    return "?"
+
+
+def redact_plan(plan):
+    if isinstance(plan, dict):
+        return {k: normalize(v) if k in PLAN_VALUE_FIELDS else redact_plan(v) for k, v in plan.items()}
+    if isinstance(plan, list):
+        return [redact_plan(item) for item in plan]
+    return plan
+
+
+def command_shape(name: str, command: dict) -> str:
+    collection = command.get(name)
+    parts = {}
+    if name in FILTER_FIELDS:
+        parts = {f: normalize(command[f]) for f in FILTER_FIELDS[name] if command.get(f)}
+    elif name == "aggregate":
+        parts = {"pipeline": [{k: normalize(v) for k, v in stage.items()} for stage in command.get("pipeline", [])]}
+    elif name in ("update", "delete"):
+        statements = command.get("updates" if name == "update" else "deletes", [])
+        parts = {"q": normalize([s.get("q", {}) for s in statements])}
+    body = json.dumps(parts, sort_keys=True, separators=(",", ":")) if parts else ""
+    return f"{name} {collection} {body}".rstrip()
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ShapeStats:
+    __slots__ = ("shape", "command", "collection", "count", "failures", "total_ms", "max_ms",
+                 "latencies", "slow", "plan", "explained_at")
+
+    def __init__(self, shape: str, command: str, collection: Optional[str]):
+        self.shape = shape
+        self.command = command
+        self.collection = collection
+        self.count = 0
+        self.failures = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.latencies = deque(maxlen=WINDOW)
+        self.slow = deque(maxlen=SLOW_SAMPLES)
+        self.plan = None
+        self.explained_at = 0.0
+
+
+class QueryProfiler(monitoring.CommandListener):
+    def __init__(self, slow_ms: float = 100.0):
+        self.slow_ms = slow_ms
+        self.shapes: "OrderedDict[str, ShapeStats]" = OrderedDict()
+        self.pending: Dict[tuple, tuple] = {}
+        self.lock = threading.Lock()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.db = None
+        # The loop only holds weak references to tasks, keep explains alive here
+        self.tasks = set()
+
+    def attach(self, loop: asyncio.AbstractEventLoop, db):
+        """Enable background explains, run against db on loop"""
+        self.loop = loop
+        self.db = db
+
+    # --- pymongo listener interface ---
+
+    def started(self, event):
+        if event.command_name in IGNORED:
+            return
+        command = event.command
+        key = (event.request_id, event.connection_id)
+        collection = command.get(event.command_name)
+        if not isinstance(collection, str):
+            collection = None  # database-level commands such as aggregate: 1
+        entry = (command_shape(event.command_name, command), collection, event.database_name, command)
+        with self.lock:
+            self.pending[key] = entry
+
+    def succeeded(self, event):
+        self.finish(event, failed=False)
+
+    def failed(self, event):
+        self.finish(event, failed=True)
+
+    def finish(self, event, failed: bool):
+        key = (event.request_id, event.connection_id)
+        duration_ms = event.duration_micros / 1000
+        explain = None
+        with self.lock:
+            entry = self.pending.pop(key, None)
+            if entry is None:
+                return
+            shape, collection, database, command = entry
+            stats = self.shapes.get(shape)
+            if stats is None:
+                stats = ShapeStats(shape, event.command_name, collection)
+                self.shapes[shape] = stats
+                if len(self.shapes) > MAX_SHAPES:
+                    self.shapes.popitem(last=False)
+            else:
+                self.shapes.move_to_end(shape)
+
+            stats.count += 1
+            stats.failures += failed
+            stats.total_ms += duration_ms
+            stats.max_ms = max(stats.max_ms, duration_ms)
+            stats.latencies.append(duration_ms)
+
+            if duration_ms >= self.slow_ms:
+                stats.slow.append({"durationMs": round(duration_ms, 3), "at": datetime.utcnow()})
+                now = time.monotonic()
+                if event.command_name in EXPLAINABLE and now - stats.explained_at > EXPLAIN_INTERVAL_SECONDS:
+                    stats.explained_at = now
+                    explain = (stats, database, command)
+
+        if explain and self.loop is not None and self.db is not None:
+            self.loop.call_soon_threadsafe(self.start_explain, *explain)
+
+    # --- helpers ---
+
+    def start_explain(self, stats: ShapeStats, database: str, command: dict):
+        task = asyncio.ensure_future(self.explain(stats, database, command))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    @staticmethod
+    def clean(command: dict) -> dict:
+        return {k: v for k, v in command.items() if k not in DRIVER_FIELDS}
+
+    async def explain(self, stats: ShapeStats, database: str, command: dict):
+        try:
+            result = await self.db.client[database].command(
+                {"explain": self.clean(command), "verbosity": "queryPlanner"}
+            )
+            plan = result.get("queryPlanner", {}).get("winningPlan", result)
+        except Exception as e:
+            plan = {"error": str(e)}
+        with self.lock:
+            stats.plan = redact_plan(json.loads(json.dumps(plan, default=str)))
+
+    def snapshot(self, limit: int = 50) -> List[dict]:
+        """Per-shape stats ordered by total time spent, heaviest first"""
+        with self.lock:
+            shapes = [(s, sorted(s.latencies), list(s.slow), s.plan) for s in self.shapes.values()]
+        shapes.sort(key=lambda item: item[0].total_ms, reverse=True)
+        return [
+            {
+                "shape": s.shape,
+                "command": s.command,
+                "collection": s.collection,
+                "count": s.count,
+                "failures": s.failures,
+                "totalMs": round(s.total_ms, 3),
+                "meanMs": round(s.total_ms / s.count, 3),
+                "p50Ms": round(percentile(ordered, 0.50), 3),
+                "p95Ms": round(percentile(ordered, 0.95), 3),
+                "p99Ms": round(percentile(ordered, 0.99), 3),
+                "maxMs": round(s.max_ms, 3),
+                "slowSamples": slow,
+                "plan": plan,
+            }
+            for s, ordered, slow, plan in shapes[:limit]
+        ]
+
+    def reset(self):
+        with self.lock:
+            self.shapes.clear()
@@ -0,0 +1,203 @@
+"""
+In-memory "you may also like" index for products.
+
+Every product becomes one L2-normalised feature vector made of three weighted
+blocks: TF-IDF of name and description, a hashed category one-hot, and a
+log-scale price band one-hot. Because each block is normalised and scaled by
+the square root of its weight, the dot product of two vectors is the weighted
+sum of the per-block cosine similarities.
+
+The top neighbours of every product are precomputed, so serving a request is
+a dictionary lookup. Writes update the affected vectors and neighbour lists in
+place; a list that loses an entry it cannot replace from what it holds is
+recomputed from the matrix. Terms first seen after the last full build are
+ignored until the next rebuild, which ``needs_rebuild`` signals after enough
+writes.
+
+Writes are meant to run off the event loop. They are serialised by a lock and
+build a new neighbour mapping that is swapped in when they finish, so
+``related`` never takes the lock and always reads a complete mapping. The index
+holds product ids only; callers load the documents themselves.
+
+This module imports NumPy and is only loaded when the index is first built.
+"""
+
+import math
+import re
+import threading
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+TEXT_WEIGHT = 0.5
+CATEGORY_WEIGHT = 0.35
+PRICE_WEIGHT = 0.15
+
+MAX_TERMS = 1024
+CATEGORY_BUCKETS = 32
+PRICE_BANDS = 8
+PRICE_BAND_BASE = 100.0  # prices below this share the lowest band
+BUILD_BLOCK = 512
+
+TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(product: dict) -> List[str]:
+    text = f"{product.get('name', '')} {product.get('description', '')}".lower()
+    return [t for t in TOKEN.findall(text) if len(t) > 1]
+
+
+def price_band(price: float) -> int:
+    if price <= PRICE_BAND_BASE:
+        return 0
+    return min(int(math.log2(price / PRICE_BAND_BASE)) + 1, PRICE_BANDS - 1)
+
+
+class RelatedProductsIndex:
+    def __init__(self, top_k: int = 20):
+        self.top_k = top_k
+        self.lock = threading.Lock()
+        self.vocab: Dict[str, int] = {}
+        self.idf = np.zeros(0, dtype=np.float32)
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.matrix = np.zeros((0, self.dimensions), dtype=np.float32)
+        self.neighbours: Dict[str, List[Tuple[float, str]]] = {}
+        self.writes_since_build = 0
+
+    @property
+    def dimensions(self) -> int:
+        return len(self.vocab) + CATEGORY_BUCKETS + PRICE_BANDS
+
+    @property
+    def needs_rebuild(self) -> bool:
+        return self.writes_since_build > max(20, len(self.ids) // 10)
+
+    def vectorize(self, product: dict) -> np.ndarray:
+        vec = np.zeros(self.dimensions, dtype=np.float32)
+
+        counts = Counter(t for t in tokenize(product) if t in self.vocab)
+        if counts:
+            text = vec[:len(self.vocab)]
+            for term, n in counts.items():
+                text[self.vocab[term]] = n * self.idf[self.vocab[term]]
+            text *= math.sqrt(TEXT_WEIGHT) / np.linalg.norm(text)
+
+        offset = len(self.vocab)
+        bucket = zlib.crc32(str(product.get('category', '')).lower().encode()) % CATEGORY_BUCKETS
+        vec[offset + bucket] = math.sqrt(CATEGORY_WEIGHT)
+
+        offset += CATEGORY_BUCKETS
+        vec[offset + price_band(float(product.get('price', 0)))] = math.sqrt(PRICE_WEIGHT)
+
+        return vec / np.linalg.norm(vec)
+
+    def build(self, products: List[dict]):
+        """Rebuild vocabulary, vectors and neighbour lists from scratch"""
+        doc_freq = Counter()
+        for p in products:
+            doc_freq.update(set(tokenize(p)))
+        terms = [t for t, _ in doc_freq.most_common(MAX_TERMS)]
+        self.vocab = {t: i for i, t in enumerate(terms)}
+        n = len(products)
+        self.idf = np.array([math.log((1 + n) / (1 + doc_freq[t])) + 1 for t in terms], dtype=np.float32)
+
+        self.ids = [p['id'] for p in products]
+        self.rows = {pid: i for i, pid in enumerate(self.ids)}
+        self.matrix = np.stack([self.vectorize(p) for p in products]) if products \
+            else np.zeros((0, self.dimensions), dtype=np.float32)
+
+        neighbours = {}
+        self.recompute(neighbours, self.ids)
+        self.neighbours = neighbours
+        self.writes_since_build = 0
+
+    def recompute(self, neighbours: dict, product_ids: List[str]):
+        """Recompute the neighbour lists of product_ids from the matrix"""
+        k = min(self.top_k, len(self.ids) - 1)
+        for start in range(0, len(product_ids), BUILD_BLOCK):
+            block = product_ids[start:start + BUILD_BLOCK]
+            rows = [self.rows[pid] for pid in block]
+            sims = self.matrix[rows] @ self.matrix.T
+            for pid, row, own in zip(block, sims, rows):
+                row[own] = -np.inf
+                neighbours[pid] = self.top_of(row, k)
+
+    def top_of(self, sims: np.ndarray, k: int) -> List[Tuple[float, str]]:
+        if k <= 0:
+            return []
+        best = np.argpartition(-sims, k - 1)[:k]
+        return sorted(((float(sims[i]), self.ids[i]) for i in best), reverse=True)
+
+    def apply(self, upserts: Iterable[dict] = (), removals: Iterable[str] = ()):
+        """Apply a batch of changes under a single lock acquisition"""
+        with self.lock:
+            neighbours = dict(self.neighbours)
+            for product_id in removals:
+                self._remove(neighbours, product_id)
+            for product in upserts:
+                self._upsert(neighbours, product)
+            self.neighbours = neighbours
+
+    def upsert(self, product: dict):
+        self.apply(upserts=[product])
+
+    def remove(self, product_id: str):
+        self.apply(removals=[product_id])
+
+    def _upsert(self, neighbours: dict, product: dict):
+        pid = product['id']
+        vec = self.vectorize(product)
+        if pid in self.rows:
+            self.matrix[self.rows[pid]] = vec
+        else:
+            self.rows[pid] = len(self.ids)
+            self.ids.append(pid)
+            self.matrix = np.vstack([self.matrix, vec])
+
+        sims = self.matrix @ vec
+        sims[self.rows[pid]] = -np.inf
+        k = min(self.top_k, len(self.ids) - 1)
+        neighbours[pid] = self.top_of(sims, k)
+        stale = []
+        for other, row in self.rows.items():
+            if other == pid:
+                continue
+            old = neighbours.get(other, [])
+            entries = [e for e in old if e[1] != pid]
+            score = float(sims[row])
+            if len(entries) < len(old) and len(old) >= k and score < old[-1][0]:
+                # pid dropped below the old cut-off; something outside the
+                # list may now rank higher than it
+                stale.append(other)
+                continue
+            entries.append((score, pid))
+            entries.sort(reverse=True)
+            neighbours[other] = entries[:k]
+        self.recompute(neighbours, stale)
+        self.writes_since_build += 1
+
+    def _remove(self, neighbours: dict, product_id: str):
+        row = self.rows.pop(product_id, None)
+        if row is None:
+            return
+        self.matrix = np.delete(self.matrix, row, axis=0)
+        del self.ids[row]
+        self.rows = {pid: i for i, pid in enumerate(self.ids)}
+        neighbours.pop(product_id, None)
+        short = []
+        for other, entries in neighbours.items():
+            if any(e[1] == product_id for e in entries):
+                short.append(other)
+        # Lists that held the removed product are one short; refill them
+        self.recompute(neighbours, short)
+        self.writes_since_build += 1
+
+    def related(self, product_id: str, limit: int) -> Optional[List[str]]:
+        """Ids of the most similar products, or None when the product is not indexed"""
+        entries = self.neighbours.get(product_id)
+        if entries is None:
+            return None
+        return [pid for _, pid in entries[:limit]]
@@ -0,0 +1,102 @@
+"""
+Production entry point for the Shri Radhe Beauty backend.
+
+    python serve.py --workers 4
+    python serve.py --server gunicorn --workers 4
+
+Each worker opens its own Mongo client in the app lifespan, warms indexes and
+hot queries before accepting traffic, and on SIGTERM stops accepting new
+connections and lets in-flight requests finish before closing the client.
+"""
+
+import importlib.util
+import multiprocessing
+import os
+from pathlib import Path
+
+import typer
+
+ROOT_DIR = Path(__file__).parent
+APP_PATH = "server:app"
+
+cli = typer.Typer(add_completion=False)
+
+
+def has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def default_workers() -> int:
+    return int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+
+
+def event_loop() -> str:
+    return "uvloop" if has_module("uvloop") else "asyncio"
+
+
+def http_protocol() -> str:
+    return "httptools" if has_module("httptools") else "h11"
+
+
+def run_uvicorn(host: str, port: int, workers: int, graceful_timeout: int):
+    import uvicorn
+
+    uvicorn.run(
+        APP_PATH,
+        app_dir=str(ROOT_DIR),
+        host=host,
+        port=port,
+        workers=workers,
+        loop=event_loop(),
+        http=http_protocol(),
+        lifespan="on",
+        timeout_graceful_shutdown=graceful_timeout,
+        proxy_headers=True,
+    )
+
+
+def run_gunicorn(host: str, port: int, workers: int, graceful_timeout: int):
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise typer.BadParameter("gunicorn is not installed", param_hint="--server")
+
+    class StandaloneApplication(BaseApplication):
+        def load_config(self):
+            settings = {
+                "bind": f"{host}:{port}",
+                "workers": workers,
+                "worker_class": "uvicorn.workers.UvicornWorker",
+                "graceful_timeout": graceful_timeout,
+                "chdir": str(ROOT_DIR),
+                # Workers import the app themselves; nothing is shared across fork
+                "preload_app": False,
+            }
+            for key, value in settings.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from server import app
+            return app
+
+    StandaloneApplication().run()
+
+
+@cli.command()
+def main(
+    host: str = typer.Option("0.0.0.0", help="Interface to bind"),
+    port: int = typer.Option(8001, help="Port to bind"),
+    workers: int = typer.Option(default_workers(), help="Number of worker processes"),
+    server: str = typer.Option("uvicorn", help="uvicorn or gunicorn"),
+    graceful_timeout: int = typer.Option(30, help="Seconds to drain in-flight requests on shutdown"),
+):
+    if server == "uvicorn":
+        run_uvicorn(host, port, workers, graceful_timeout)
+    elif server == "gunicorn":
+        run_gunicorn(host, port, workers, graceful_timeout)
+    else:
+        raise typer.BadParameter("must be uvicorn or gunicorn", param_hint="--server")
+
+
+if __name__ == "__main__":
+    cli()
@@ -1,26 +1,64 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Body
+from fastapi import FastAPI, APIRouter, HTTPException, Body, Query, Response
+from fastapi.encoders import jsonable_encoder
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from contextlib import asynccontextmanager
+import asyncio
+import json
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 from bson import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
 import hashlib
+from maintenance import (
+    LIVE, RATING_VALUES, REVIEW_SUMMARY_ID, SOFT_DELETE_COLLECTIONS,
+    backfill_deleted_flags, create_indexes, rebuild_review_summary, review_summary_write
+)
+from query_profiler import QueryProfiler
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection. The client is opened inside each worker's lifespan
+# rather than at import, so forked workers never share a client or socket.
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+client: Optional[AsyncIOMotorClient] = None
+db = None
+
+# Per-worker query-shape profiler, fed by pymongo command monitoring
+query_profiler = QueryProfiler(slow_ms=float(os.environ.get('SLOW_QUERY_MS', '100')))
+
+# Bookings are entered in the salon's local time
+SALON_TZ = ZoneInfo(os.environ.get('SALON_TIMEZONE', 'Asia/Kolkata'))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global client, db, related_index
+    client = AsyncIOMotorClient(mongo_url, event_listeners=[query_profiler])
+    db = client[os.environ['DB_NAME']]
+    related_index = None  # built for this database by refresh_related_index_loop
+    query_profiler.attach(asyncio.get_running_loop(), db)
+    background = []
+    try:
+        await warm_up()
+        background.append(asyncio.create_task(refresh_related_index_loop()))
+        background.append(asyncio.create_task(compaction_loop()))
+        logger.info("Worker %s ready", os.getpid())
+        yield
+    finally:
+        for task in background:
+            task.cancel()
+        client.close()
 
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -31,6 +69,63 @@ def str_object_id(doc):
         doc['_id'] = str(doc['_id'])
     return doc
 
+# Stamp a document with its last-modified time for delta sync
+def stamp_updated(doc):
+    doc['updatedAt'] = datetime.utcnow()
+    return doc
+
+# Soft-deleted documents stay as tombstones this long before compaction
+SOFT_DELETE_RETENTION = timedelta(days=30)
+
+def new_doc(doc):
+    doc['deleted'] = False
+    return stamp_updated(doc)
+
+async def soft_delete(collection: str, doc_id: str) -> bool:
+    now = datetime.utcnow()
+    result = await db[collection].update_one(
+        {"_id": ObjectId(doc_id), **LIVE},
+        {"$set": {"deleted": True, "deletedAt": now, "updatedAt": now}}
+    )
+    return result.matched_count > 0
+
+# ============= Request Coalescing =============
+
+class SingleFlight:
+    """Share one in-flight fetch between identical concurrent requests.
+
+    The fetch runs as its own task, so a caller that disconnects does not
+    cancel it for the others still waiting on the result.
+    """
+
+    def __init__(self):
+        self.inflight: Dict[tuple, asyncio.Task] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: tuple, fetch):
+        task = self.inflight.get(key)
+        if task is None:
+            self.executed += 1
+            task = asyncio.ensure_future(fetch())
+            self.inflight[key] = task
+            task.add_done_callback(lambda _: self.inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+catalog_flight = SingleFlight()
+
+async def coalesced_json(route: str, params: dict, fetch) -> Response:
+    """Run fetch once per burst of identical requests and serialize it once"""
+    key = (route, tuple(sorted((k, v) for k, v in params.items() if v is not None)))
+
+    async def fetch_serialized() -> bytes:
+        return json.dumps(jsonable_encoder(await fetch())).encode()
+
+    body = await catalog_flight.do(key, fetch_serialized)
+    return Response(content=body, media_type="application/json")
+
 # ============= Models =============
 
 class Product(BaseModel):
@@ -45,6 +140,7 @@ class Product(BaseModel):
 
 class ProductResponse(Product):
     id: str
+    updatedAt: Optional[datetime] = None
 
 class Booking(BaseModel):
     name: str
@@ -59,16 +155,35 @@ class Booking(BaseModel):
 
 class BookingResponse(Booking):
     id: str
+    appointmentAt: Optional[datetime] = None  # UTC, parsed from date/time
+
+class CalendarEntry(BaseModel):
+    id: str
+    appointmentAt: datetime  # salon local time
+    name: str
+    phone: str
+    service: str
+    status: str
+
+class CalendarDay(BaseModel):
+    date: date
+    bookings: List[CalendarEntry]
 
 class Review(BaseModel):
     name: str
-    rating: int  # 1-5
+    rating: int = Field(..., ge=1, le=5)
     comment: str
     approved: bool = False
     createdAt: datetime = Field(default_factory=datetime.utcnow)
 
 class ReviewResponse(Review):
     id: str
+    updatedAt: Optional[datetime] = None
+
+class ReviewSummary(BaseModel):
+    count: int
+    average: float
+    histogram: Dict[str, int]
 
 class Service(BaseModel):
     name: str
@@ -80,6 +195,7 @@ class Service(BaseModel):
 
 class ServiceResponse(Service):
     id: str
+    updatedAt: Optional[datetime] = None
 
 class GalleryItem(BaseModel):
     image: str  # base64
@@ -88,6 +204,46 @@ class GalleryItem(BaseModel):
 
 class GalleryResponse(GalleryItem):
     id: str
+    updatedAt: Optional[datetime] = None
+
+class CoalescingStats(BaseModel):
+    executed: int
+    coalesced: int
+    inflight: int
+
+class SlowQuerySample(BaseModel):
+    durationMs: float
+    at: datetime
+
+class QueryShapeStats(BaseModel):
+    shape: str
+    command: str
+    collection: Optional[str] = None
+    count: int
+    failures: int
+    totalMs: float
+    meanMs: float
+    p50Ms: float
+    p95Ms: float
+    p99Ms: float
+    maxMs: float
+    slowSamples: List[SlowQuerySample]
+    plan: Optional[dict] = None
+
+class SyncDeleted(BaseModel):
+    products: List[str] = []
+    services: List[str] = []
+    gallery: List[str] = []
+    reviews: List[str] = []
+
+class SyncResponse(BaseModel):
+    token: str
+    full: bool
+    products: List[ProductResponse]
+    services: List[ServiceResponse]
+    gallery: List[GalleryResponse]
+    reviews: List[ReviewResponse]
+    deleted: SyncDeleted
 
 class AdminLogin(BaseModel):
     username: str
@@ -100,31 +256,102 @@ class AdminResponse(BaseModel):
 
 # ============= Products APIs =============
 
+# Similar-product index, held in memory per worker. NumPy is only imported
+# when it is first built. Each worker applies its own writes immediately and
+# picks up other workers' writes, deletions included, from updatedAt stamps.
+# It is built in the background after startup; until then the endpoint
+# answers 503. Only the fields it vectorizes are loaded, never the images.
+RELATED_REFRESH_SECONDS = 30
+RELATED_FIELDS = ("name", "description", "category", "price")
+RELATED_PROJECTION = {**{f: 1 for f in RELATED_FIELDS}, "deleted": 1}
+related_index = None
+related_synced_at: Optional[datetime] = None
+
+def related_doc(p) -> dict:
+    return {"id": str(p['_id']), **{f: p.get(f) for f in RELATED_FIELDS}}
+
+async def build_related_index():
+    global related_index, related_synced_at
+    from recommendations import RelatedProductsIndex
+
+    synced_at = datetime.utcnow()
+    products = [related_doc(p) async for p in db.products.find(LIVE, RELATED_PROJECTION)]
+    index = RelatedProductsIndex()
+    await asyncio.to_thread(index.build, products)
+    related_index, related_synced_at = index, synced_at
+
+async def refresh_related_index():
+    global related_synced_at
+    if related_index is None or related_index.needs_rebuild:
+        await build_related_index()
+        return
+    synced_at = datetime.utcnow()
+    cutoff = related_synced_at - SYNC_OVERLAP
+    upserts, removals = [], []
+    async for p in db.products.find({"updatedAt": {"$gte": cutoff}}, RELATED_PROJECTION):
+        if p.get('deleted'):
+            removals.append(str(p['_id']))
+        else:
+            upserts.append(related_doc(p))
+    await asyncio.to_thread(related_index.apply, upserts, removals)
+    related_synced_at = synced_at
+
+async def refresh_related_index_loop():
+    # The first pass builds the index
+    while True:
+        try:
+            await refresh_related_index()
+        except Exception:
+            logger.exception("Refreshing the related products index failed")
+        await asyncio.sleep(RELATED_REFRESH_SECONDS)
+
 @api_router.get("/products", response_model=List[ProductResponse])
 async def get_products(category: Optional[str] = None, featured: Optional[bool] = None):
-    query = {}
+    query = dict(LIVE)
     if category:
         query['category'] = category
     if featured is not None:
         query['featured'] = featured
     
-    products = await db.products.find(query).to_list(100)
-    return [ProductResponse(id=str(p['_id']), **{k: v for k, v in p.items() if k != '_id'}) for p in products]
+    async def fetch():
+        products = await db.products.find(query).to_list(100)
+        return [ProductResponse(id=str(p['_id']), **{k: v for k, v in p.items() if k != '_id'}) for p in products]
+    return await coalesced_json("products", query, fetch)
+
+@api_router.get("/products/{product_id}/related", response_model=List[ProductResponse])
+async def get_related_products(product_id: str, limit: int = Query(6, ge=1, le=20)):
+    if related_index is None:
+        raise HTTPException(status_code=503, detail="Recommendations are not ready yet")
+    related_ids = related_index.related(product_id, limit)
+    if related_ids is None:
+        raise HTTPException(status_code=404, detail="Product not found")
+    products = {
+        str(p['_id']): p
+        async for p in db.products.find({"_id": {"$in": [ObjectId(i) for i in related_ids]}, **LIVE})
+    }
+    return [
+        ProductResponse(id=i, **{k: v for k, v in products[i].items() if k != '_id'})
+        for i in related_ids if i in products
+    ]
 
 @api_router.get("/products/{product_id}", response_model=ProductResponse)
 async def get_product(product_id: str):
     try:
-        product = await db.products.find_one({"_id": ObjectId(product_id)})
+        product = await db.products.find_one({"_id": ObjectId(product_id), **LIVE})
         if not product:
             raise HTTPException(status_code=404, detail="Product not found")
         return ProductResponse(id=str(product['_id']), **{k: v for k, v in product.items() if k != '_id'})
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @api_router.post("/products", response_model=ProductResponse)
 async def create_product(product: Product):
-    product_dict = product.dict()
+    product_dict = new_doc(product.dict())
     result = await db.products.insert_one(product_dict)
+    if related_index is not None:
+        await asyncio.to_thread(related_index.upsert, related_doc(product_dict))
     product_dict['id'] = str(result.inserted_id)
     return ProductResponse(**product_dict)
 
@@ -132,29 +359,95 @@ async def create_product(product: Product):
 async def update_product(product_id: str, product: Product):
     try:
         result = await db.products.update_one(
-            {"_id": ObjectId(product_id)},
-            {"$set": product.dict()}
+            {"_id": ObjectId(product_id), **LIVE},
+            {"$set": stamp_updated(product.dict())}
         )
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Product not found")
         
         updated_product = await db.products.find_one({"_id": ObjectId(product_id)})
+        if related_index is not None:
+            await asyncio.to_thread(related_index.upsert, related_doc(updated_product))
         return ProductResponse(id=str(updated_product['_id']), **{k: v for k, v in updated_product.items() if k != '_id'})
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @api_router.delete("/products/{product_id}")
 async def delete_product(product_id: str):
     try:
-        result = await db.products.delete_one({"_id": ObjectId(product_id)})
-        if result.deleted_count == 0:
+        if not await soft_delete("products", product_id):
             raise HTTPException(status_code=404, detail="Product not found")
+        if related_index is not None:
+            await asyncio.to_thread(related_index.remove, product_id)
         return {"message": "Product deleted successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 # ============= Bookings APIs =============
 
+BOOKING_DATE_FORMATS = ("%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y", "%d.%m.%Y")
+BOOKING_TIME_FORMATS = ("%I:%M %p", "%I:%M%p", "%I %p", "%I%p", "%H:%M")
+CALENDAR_MAX_DAYS = 62
+MIGRATION_BATCH = 500
+
+def parse_booking_date(value: str) -> Optional[date]:
+    for fmt in BOOKING_DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), fmt).date()
+        except ValueError:
+            continue
+    return None
+
+def parse_appointment(date_str: str, time_str: str) -> Optional[datetime]:
+    """Turn the free-form booking date/time into a naive UTC datetime.
+
+    Returns None when either part is unrecognised; such bookings are still
+    stored, they just do not show up on the calendar.
+    """
+    day = parse_booking_date(date_str)
+    if day is None:
+        return None
+    for fmt in BOOKING_TIME_FORMATS:
+        try:
+            clock = datetime.strptime(time_str.strip().upper(), fmt).time()
+            break
+        except ValueError:
+            continue
+    else:
+        return None
+    local = datetime.combine(day, clock, tzinfo=SALON_TZ)
+    return local.astimezone(timezone.utc).replace(tzinfo=None)
+
+def salon_day_start(day: date) -> datetime:
+    local = datetime.combine(day, datetime.min.time(), tzinfo=SALON_TZ)
+    return local.astimezone(timezone.utc).replace(tzinfo=None)
+
+async def backfill_appointment_times():
+    """Parse appointmentAt for bookings stored before it existed"""
+    updated = unparsed = 0
+    batch = []
+    cursor = db.bookings.find(
+        {"appointmentAt": {"$exists": False}},
+        {"date": 1, "time": 1}
+    )
+    async for b in cursor:
+        appointment_at = parse_appointment(b.get('date', ''), b.get('time', ''))
+        batch.append(UpdateOne({"_id": b['_id']}, {"$set": {"appointmentAt": appointment_at}}))
+        if appointment_at is None:
+            unparsed += 1
+        else:
+            updated += 1
+        if len(batch) == MIGRATION_BATCH:
+            await db.bookings.bulk_write(batch, ordered=False)
+            batch = []
+    if batch:
+        await db.bookings.bulk_write(batch, ordered=False)
+    return {"updated": updated, "unparsed": unparsed}
+
 @api_router.get("/bookings", response_model=List[BookingResponse])
 async def get_bookings(status: Optional[str] = None):
     query = {}
@@ -167,10 +460,54 @@ async def get_bookings(status: Optional[str] = None):
 @api_router.post("/bookings", response_model=BookingResponse)
 async def create_booking(booking: Booking):
     booking_dict = booking.dict()
+    booking_dict['appointmentAt'] = parse_appointment(booking.date, booking.time)
     result = await db.bookings.insert_one(booking_dict)
     booking_dict['id'] = str(result.inserted_id)
     return BookingResponse(**booking_dict)
 
+@api_router.get("/bookings/calendar", response_model=List[CalendarDay])
+async def get_booking_calendar(
+    from_date: date = Query(..., alias="from"),
+    to_date: date = Query(..., alias="to"),
+    status: Optional[str] = None
+):
+    """Bookings between two salon-local dates (inclusive), grouped by day"""
+    if to_date < from_date:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    if (to_date - from_date).days >= CALENDAR_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range is limited to {CALENDAR_MAX_DAYS} days")
+
+    query = {
+        "appointmentAt": {
+            "$gte": salon_day_start(from_date),
+            "$lt": salon_day_start(to_date + timedelta(days=1))
+        }
+    }
+    if status:
+        query['status'] = status
+
+    cursor = db.bookings.find(
+        query,
+        {"appointmentAt": 1, "name": 1, "phone": 1, "service": 1, "status": 1}
+    ).sort("appointmentAt", 1)
+
+    days: Dict[date, List[CalendarEntry]] = {}
+    async for b in cursor:
+        local = b['appointmentAt'].replace(tzinfo=timezone.utc).astimezone(SALON_TZ)
+        days.setdefault(local.date(), []).append(CalendarEntry(
+            id=str(b['_id']),
+            appointmentAt=local,
+            name=b['name'],
+            phone=b['phone'],
+            service=b['service'],
+            status=b['status']
+        ))
+    return [CalendarDay(date=day, bookings=entries) for day, entries in days.items()]
+
+@api_router.post("/bookings/calendar/migrate")
+async def migrate_booking_calendar():
+    return await backfill_appointment_times()
+
 @api_router.put("/bookings/{booking_id}", response_model=BookingResponse)
 async def update_booking_status(booking_id: str, status: str = Body(..., embed=True)):
     try:
@@ -183,39 +520,76 @@ async def update_booking_status(booking_id: str, status: str = Body(..., embed=T
         
         updated_booking = await db.bookings.find_one({"_id": ObjectId(booking_id)})
         return BookingResponse(id=str(updated_booking['_id']), **{k: v for k, v in updated_booking.items() if k != '_id'})
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 # ============= Reviews APIs =============
 
+# The rating summary document (REVIEW_SUMMARY_ID) is maintained in maintenance.py
+def review_summary_response(summary) -> ReviewSummary:
+    summary = summary or {}
+    count = summary.get('count', 0)
+    stored = summary.get('histogram', {})
+    return ReviewSummary(
+        count=count,
+        average=round(summary.get('sum', 0) / count, 2) if count else 0.0,
+        histogram={str(r): stored.get(str(r), 0) for r in RATING_VALUES}
+    )
+
 @api_router.get("/reviews", response_model=List[ReviewResponse])
 async def get_reviews(approved: Optional[bool] = None):
     query = {}
     if approved is not None:
         query['approved'] = approved
     
-    reviews = await db.reviews.find(query).sort("createdAt", -1).to_list(100)
-    return [ReviewResponse(id=str(r['_id']), **{k: v for k, v in r.items() if k != '_id'}) for r in reviews]
+    async def fetch():
+        reviews = await db.reviews.find(query).sort("createdAt", -1).to_list(100)
+        return [ReviewResponse(id=str(r['_id']), **{k: v for k, v in r.items() if k != '_id'}) for r in reviews]
+    return await coalesced_json("reviews", query, fetch)
 
 @api_router.post("/reviews", response_model=ReviewResponse)
 async def create_review(review: Review):
-    review_dict = review.dict()
-    result = await db.reviews.insert_one(review_dict)
+    review_dict = stamp_updated(review.dict())
+    async with review_summary_write(db) as summary_changes:
+        result = await db.reviews.insert_one(review_dict)
+        if review.approved:
+            summary_changes.append((review.rating, 1))
     review_dict['id'] = str(result.inserted_id)
     return ReviewResponse(**review_dict)
 
+@api_router.get("/reviews/summary", response_model=ReviewSummary)
+async def get_review_summary():
+    summary = await db.review_summary.find_one({"_id": REVIEW_SUMMARY_ID})
+    return review_summary_response(summary)
+
+@api_router.post("/reviews/summary/rebuild", response_model=ReviewSummary)
+async def rebuild_review_summary_endpoint():
+    summary = await rebuild_review_summary(db)
+    return review_summary_response(summary)
+
 @api_router.put("/reviews/{review_id}", response_model=ReviewResponse)
 async def approve_review(review_id: str, approved: bool = Body(..., embed=True)):
     try:
-        result = await db.reviews.update_one(
-            {"_id": ObjectId(review_id)},
-            {"$set": {"approved": approved}}
-        )
-        if result.matched_count == 0:
+        # The pre-image tells us whether the approval actually flipped, so
+        # repeated approve/unapprove calls never double-count in the summary.
+        changes = stamp_updated({"approved": approved})
+        async with review_summary_write(db) as summary_changes:
+            previous = await db.reviews.find_one_and_update(
+                {"_id": ObjectId(review_id)},
+                {"$set": changes},
+                return_document=ReturnDocument.BEFORE
+            )
+            if previous and previous.get('approved', False) != approved:
+                summary_changes.append((previous['rating'], 1 if approved else -1))
+        if not previous:
             raise HTTPException(status_code=404, detail="Review not found")
         
-        updated_review = await db.reviews.find_one({"_id": ObjectId(review_id)})
+        updated_review = {**previous, **changes}
         return ReviewResponse(id=str(updated_review['_id']), **{k: v for k, v in updated_review.items() if k != '_id'})
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -223,12 +597,14 @@ async def approve_review(review_id: str, approved: bool = Body(..., embed=True))
 
 @api_router.get("/services", response_model=List[ServiceResponse])
 async def get_services():
-    services = await db.services.find().to_list(100)
-    return [ServiceResponse(id=str(s['_id']), **{k: v for k, v in s.items() if k != '_id'}) for s in services]
+    async def fetch():
+        services = await db.services.find(LIVE).to_list(100)
+        return [ServiceResponse(id=str(s['_id']), **{k: v for k, v in s.items() if k != '_id'}) for s in services]
+    return await coalesced_json("services", {}, fetch)
 
 @api_router.post("/services", response_model=ServiceResponse)
 async def create_service(service: Service):
-    service_dict = service.dict()
+    service_dict = new_doc(service.dict())
     result = await db.services.insert_one(service_dict)
     service_dict['id'] = str(result.inserted_id)
     return ServiceResponse(**service_dict)
@@ -237,24 +613,27 @@ async def create_service(service: Service):
 async def update_service(service_id: str, service: Service):
     try:
         result = await db.services.update_one(
-            {"_id": ObjectId(service_id)},
-            {"$set": service.dict()}
+            {"_id": ObjectId(service_id), **LIVE},
+            {"$set": stamp_updated(service.dict())}
         )
         if result.matched_count == 0:
             raise HTTPException(status_code=404, detail="Service not found")
         
         updated_service = await db.services.find_one({"_id": ObjectId(service_id)})
         return ServiceResponse(id=str(updated_service['_id']), **{k: v for k, v in updated_service.items() if k != '_id'})
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @api_router.delete("/services/{service_id}")
 async def delete_service(service_id: str):
     try:
-        result = await db.services.delete_one({"_id": ObjectId(service_id)})
-        if result.deleted_count == 0:
+        if not await soft_delete("services", service_id):
             raise HTTPException(status_code=404, detail="Service not found")
         return {"message": "Service deleted successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -262,12 +641,14 @@ async def delete_service(service_id: str):
 
 @api_router.get("/gallery", response_model=List[GalleryResponse])
 async def get_gallery():
-    items = await db.gallery.find().sort("createdAt", -1).to_list(100)
-    return [GalleryResponse(id=str(i['_id']), **{k: v for k, v in i.items() if k != '_id'}) for i in items]
+    async def fetch():
+        items = await db.gallery.find(LIVE).sort("createdAt", -1).to_list(100)
+        return [GalleryResponse(id=str(i['_id']), **{k: v for k, v in i.items() if k != '_id'}) for i in items]
+    return await coalesced_json("gallery", {}, fetch)
 
 @api_router.post("/gallery", response_model=GalleryResponse)
 async def add_gallery_item(item: GalleryItem):
-    item_dict = item.dict()
+    item_dict = new_doc(item.dict())
     result = await db.gallery.insert_one(item_dict)
     item_dict['id'] = str(result.inserted_id)
     return GalleryResponse(**item_dict)
@@ -275,13 +656,129 @@ async def add_gallery_item(item: GalleryItem):
 @api_router.delete("/gallery/{item_id}")
 async def delete_gallery_item(item_id: str):
     try:
-        result = await db.gallery.delete_one({"_id": ObjectId(item_id)})
-        if result.deleted_count == 0:
+        if not await soft_delete("gallery", item_id):
             raise HTTPException(status_code=404, detail="Gallery item not found")
         return {"message": "Gallery item deleted successfully"}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+# ============= Sync APIs =============
+
+# Writes that land while a sync query is running can carry an updatedAt just
+# before the token we hand out, so every delta query reaches back this far.
+# Clients upsert by id, so the overlap only costs a few duplicate documents.
+SYNC_OVERLAP = timedelta(seconds=5)
+SYNC_COLLECTIONS = {
+    "products": ProductResponse,
+    "services": ServiceResponse,
+    "gallery": GalleryResponse,
+    "reviews": ReviewResponse,
+}
+# Only approved reviews are public; the rest never leave the server via sync
+SYNC_FULL_QUERIES = {
+    "products": {"deleted": {"$ne": True}},
+    "services": {"deleted": {"$ne": True}},
+    "gallery": {"deleted": {"$ne": True}},
+    "reviews": {"approved": True},
+}
+
+def hidden_from_sync(collection: str, doc) -> bool:
+    if collection == "reviews":
+        return not doc.get('approved')
+    return bool(doc.get('deleted'))
+
+def encode_sync_token(moment: datetime) -> str:
+    return str(int((moment - datetime(1970, 1, 1)).total_seconds() * 1000))
+
+def decode_sync_token(token: str) -> datetime:
+    try:
+        return datetime(1970, 1, 1) + timedelta(milliseconds=int(token))
+    except (ValueError, OverflowError):
+        raise HTTPException(status_code=400, detail="Invalid sync token")
+
+@api_router.get("/sync", response_model=SyncResponse)
+async def sync_catalog(since: Optional[str] = None):
+    # Take the token before querying so nothing written meanwhile is skipped
+    now = datetime.utcnow()
+    cutoff = decode_sync_token(since) - SYNC_OVERLAP if since else None
+    # Tombstones past the retention window may already be compacted away, so
+    # a client that has been offline that long starts over with a full sync
+    full = cutoff is None or cutoff < now - SOFT_DELETE_RETENTION
+    delta_query = {"updatedAt": {"$gte": cutoff}}
+
+    deleted = SyncDeleted()
+    changed = {}
+    for collection, response_model in SYNC_COLLECTIONS.items():
+        changed[collection] = []
+        query = SYNC_FULL_QUERIES[collection] if full else delta_query
+        async for d in db[collection].find(query):
+            # Deleted documents and unapproved reviews go out as deletions, so
+            # clients drop anything that was withdrawn since their last sync
+            if hidden_from_sync(collection, d):
+                getattr(deleted, collection).append(str(d['_id']))
+            else:
+                changed[collection].append(response_model(id=str(d['_id']), **{k: v for k, v in d.items() if k != '_id'}))
+
+    return SyncResponse(token=encode_sync_token(now), full=full, deleted=deleted, **changed)
+
+# ============= Compaction =============
+
+# Expired tombstones are purged in small batches with a pause in between, so
+# compaction never holds the database for long while customers are browsing.
+# A lease in the locks collection keeps it to one worker per interval.
+COMPACTION_INTERVAL_SECONDS = 600
+COMPACTION_BATCH = 100
+COMPACTION_PAUSE_SECONDS = 0.5
+
+async def acquire_lease(name: str, seconds: int) -> bool:
+    now = datetime.utcnow()
+    try:
+        await db.locks.update_one(
+            {"_id": name, "expiresAt": {"$lt": now}},
+            {"$set": {"expiresAt": now + timedelta(seconds=seconds), "owner": os.getpid()}},
+            upsert=True
+        )
+        return True
+    except DuplicateKeyError:
+        return False
+
+async def compact_deleted(now: Optional[datetime] = None) -> Dict[str, int]:
+    """Hard-delete tombstones older than SOFT_DELETE_RETENTION.
+
+    Images are stored inline, so purging a document also frees its image.
+    """
+    cutoff = (now or datetime.utcnow()) - SOFT_DELETE_RETENTION
+    purged = {}
+    for collection in SOFT_DELETE_COLLECTIONS:
+        purged[collection] = 0
+        while True:
+            batch = await db[collection].find(
+                {"deleted": True, "deletedAt": {"$lt": cutoff}},
+                {"_id": 1}
+            ).limit(COMPACTION_BATCH).to_list(COMPACTION_BATCH)
+            if batch:
+                result = await db[collection].delete_many(
+                    {"_id": {"$in": [d['_id'] for d in batch]}, "deleted": True}
+                )
+                purged[collection] += result.deleted_count
+            if len(batch) < COMPACTION_BATCH:
+                break
+            await asyncio.sleep(COMPACTION_PAUSE_SECONDS)
+    return purged
+
+async def compaction_loop():
+    while True:
+        await asyncio.sleep(COMPACTION_INTERVAL_SECONDS)
+        try:
+            if await acquire_lease("compaction", COMPACTION_INTERVAL_SECONDS):
+                purged = await compact_deleted()
+                if any(purged.values()):
+                    logger.info("Compacted tombstones: %s", purged)
+        except Exception:
+            logger.exception("Compacting tombstones failed")
+
 # ============= Admin APIs =============
 
 @api_router.post("/admin/login", response_model=AdminResponse)
@@ -299,6 +796,27 @@ async def admin_login(credentials: AdminLogin):
     else:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
+@api_router.get("/admin/perf/coalescing", response_model=CoalescingStats)
+async def get_coalescing_stats():
+    return CoalescingStats(
+        executed=catalog_flight.executed,
+        coalesced=catalog_flight.coalesced,
+        inflight=len(catalog_flight.inflight)
+    )
+
+@api_router.get("/admin/perf/queries", response_model=List[QueryShapeStats])
+async def get_query_stats(limit: int = Query(50, ge=1, le=200)):
+    return query_profiler.snapshot(limit)
+
+@api_router.delete("/admin/perf/queries")
+async def reset_query_stats():
+    query_profiler.reset()
+    return {"message": "Query stats reset"}
+
+@api_router.post("/admin/compact")
+async def compact_now():
+    return await compact_deleted()
+
 # ============= Seed Data API =============
 
 @api_router.post("/seed-data")
@@ -353,7 +871,7 @@ async def seed_data():
             "createdAt": datetime.utcnow()
         }
     ]
-    await db.products.insert_many(products)
+    await db.products.insert_many([new_doc(doc) for doc in products])
     
     # Seed services
     services = [
@@ -382,7 +900,7 @@ async def seed_data():
             "popular": False
         }
     ]
-    await db.services.insert_many(services)
+    await db.services.insert_many([new_doc(doc) for doc in services])
     
     # Seed reviews
     reviews = [
@@ -408,7 +926,8 @@ async def seed_data():
             "createdAt": datetime.utcnow()
         }
     ]
-    await db.reviews.insert_many(reviews)
+    await db.reviews.insert_many([stamp_updated(doc) for doc in reviews])
+    await rebuild_review_summary(db)
     
     return {"message": "Data seeded successfully"}
 
@@ -430,6 +949,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
+async def warm_up():
+    """Open the connection pool and build indexes before taking traffic"""
+    await db.command("ping")
+    await backfill_deleted_flags(db)
+    await create_indexes(db)
+    # Load the hot catalog queries once so the first real request is not cold
+    await db.products.find({**LIVE, "featured": True}).to_list(100)
+    await db.review_summary.find_one({"_id": REVIEW_SUMMARY_ID})
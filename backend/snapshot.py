@@ -0,0 +1,189 @@
+"""
+Catalog snapshots: export and restore products, services, gallery and reviews.
+
+    python snapshot.py export ./snapshots/prod-2024-02-15
+    python snapshot.py restore ./snapshots/prod-2024-02-15 --drop
+
+A snapshot is a directory holding a manifest, gzip-compressed BSON chunks per
+collection, and a single image store. Base64 images are pulled out of the
+documents and stored once per distinct SHA-256, so a catalog that reuses the
+same picture many times only carries it once. Restores insert chunks in
+parallel with unordered bulk writes.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import bson
+import typer
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError
+
+from maintenance import backfill_deleted_flags, create_indexes, rebuild_review_summary
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+COLLECTIONS = ("products", "services", "gallery", "reviews")
+CHUNK_SIZE = 1000
+DUPLICATE_KEY = 11000
+FORMAT_VERSION = 1
+
+cli = typer.Typer(add_completion=False)
+
+
+def get_db():
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    return client, client[os.environ['DB_NAME']]
+
+
+def chunk_path(root: Path, collection: str, index: int) -> Path:
+    return root / f"{collection}-{index:05d}.bson.gz"
+
+
+def write_chunk(path: Path, docs: List[dict]):
+    with gzip.open(path, "wb") as f:
+        for doc in docs:
+            f.write(bson.encode(doc))
+
+
+def read_chunk(path: Path) -> List[dict]:
+    with gzip.open(path, "rb") as f:
+        return bson.decode_all(f.read())
+
+
+def extract_image(doc: dict, images: Dict[str, str]) -> dict:
+    image = doc.get('image')
+    if isinstance(image, str):
+        digest = hashlib.sha256(image.encode()).hexdigest()
+        images.setdefault(digest, image)
+        doc = {k: v for k, v in doc.items() if k != 'image'}
+        doc['imageRef'] = digest
+    return doc
+
+
+def restore_image(doc: dict, images: Dict[str, str]) -> dict:
+    digest = doc.pop('imageRef', None)
+    if digest is not None:
+        doc['image'] = images[digest]
+    return doc
+
+
+async def export_snapshot(root: Path):
+    client, db = get_db()
+    root.mkdir(parents=True, exist_ok=True)
+    images: Dict[str, str] = {}
+    manifest = {"version": FORMAT_VERSION, "createdAt": datetime.utcnow().isoformat(), "collections": {}}
+    try:
+        for collection in COLLECTIONS:
+            total = await db[collection].estimated_document_count()
+            chunks = count = 0
+            batch = []
+            with typer.progressbar(length=total, label=f"export {collection:<9}") as progress:
+                async for doc in db[collection].find({"deleted": {"$ne": True}}):
+                    batch.append(extract_image(doc, images))
+                    if len(batch) == CHUNK_SIZE:
+                        write_chunk(chunk_path(root, collection, chunks), batch)
+                        chunks += 1
+                        count += len(batch)
+                        progress.update(len(batch))
+                        batch = []
+                if batch:
+                    write_chunk(chunk_path(root, collection, chunks), batch)
+                    chunks += 1
+                    count += len(batch)
+                    progress.update(len(batch))
+            manifest["collections"][collection] = {"documents": count, "chunks": chunks}
+    finally:
+        client.close()
+
+    with gzip.open(root / "images.ndjson.gz", "wt") as f:
+        for digest, image in images.items():
+            f.write(json.dumps({"sha256": digest, "image": image}) + "\n")
+    manifest["images"] = len(images)
+    (root / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def load_images(root: Path) -> Dict[str, str]:
+    images = {}
+    with gzip.open(root / "images.ndjson.gz", "rt") as f:
+        for line in f:
+            entry = json.loads(line)
+            images[entry["sha256"]] = entry["image"]
+    return images
+
+
+async def insert_chunk(db, collection: str, path: Path, images: Dict[str, str]) -> int:
+    docs = [restore_image(doc, images) for doc in read_chunk(path)]
+    try:
+        result = await db[collection].insert_many(docs, ordered=False)
+        return len(result.inserted_ids)
+    except BulkWriteError as e:
+        # Documents whose _id already exists are skipped; any other failure is fatal
+        errors = [err for err in e.details["writeErrors"] if err["code"] != DUPLICATE_KEY]
+        if errors:
+            raise RuntimeError(
+                f"{path.name}: {len(errors)} documents failed to insert, first error: {errors[0]['errmsg']}"
+            ) from e
+        return e.details["nInserted"]
+
+
+async def restore_snapshot(root: Path, drop: bool, workers: int):
+    manifest = json.loads((root / "manifest.json").read_text())
+    if manifest.get("version") != FORMAT_VERSION:
+        raise typer.BadParameter(f"unsupported snapshot version {manifest.get('version')}")
+    images = load_images(root)
+    client, db = get_db()
+    limit = asyncio.Semaphore(workers)
+    inserted = {}
+    try:
+        for collection, info in manifest["collections"].items():
+            if drop:
+                await db[collection].delete_many({})
+            with typer.progressbar(length=info["documents"], label=f"restore {collection:<9}") as progress:
+                async def load(index: int) -> int:
+                    async with limit:
+                        n = await insert_chunk(db, collection, chunk_path(root, collection, index), images)
+                    progress.update(n)
+                    return n
+                counts = await asyncio.gather(*(load(i) for i in range(info["chunks"])))
+            inserted[collection] = sum(counts)
+
+        # Derived data is rebuilt rather than copied so it matches what landed
+        await backfill_deleted_flags(db)
+        await rebuild_review_summary(db)
+        await create_indexes(db)
+    finally:
+        client.close()
+    return inserted
+
+
+@cli.command("export")
+def export_command(path: Path = typer.Argument(..., help="Snapshot directory to create")):
+    manifest = asyncio.run(export_snapshot(path))
+    for collection, info in manifest["collections"].items():
+        typer.echo(f"{collection}: {info['documents']} documents in {info['chunks']} chunks")
+    typer.echo(f"images: {manifest['images']} unique")
+
+
+@cli.command("restore")
+def restore_command(
+    path: Path = typer.Argument(..., exists=True, file_okay=False, help="Snapshot directory"),
+    drop: bool = typer.Option(False, help="Delete existing documents in each collection first"),
+    workers: int = typer.Option(8, help="Chunks inserted concurrently"),
+):
+    inserted = asyncio.run(restore_snapshot(path, drop, workers))
+    for collection, count in inserted.items():
+        typer.echo(f"{collection}: {count} documents restored")
+
+
+if __name__ == "__main__":
+    cli()
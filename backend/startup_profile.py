@@ -0,0 +1,128 @@
+"""
+Cold-start profile for the backend.
+
+Imports server.py in a fresh interpreter under ``-X importtime``, reports the
+slowest modules by cumulative import time, then boots a single uvicorn worker
+and measures how long it takes to answer its first request (import, Mongo
+connect and warm-up included). Exits non-zero when a budget is exceeded or
+when a heavyweight package is pulled in at import time.
+
+    python startup_profile.py --import-budget-ms 800 --ready-budget-ms 3000
+"""
+
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, NamedTuple
+
+import requests
+import typer
+
+ROOT_DIR = Path(__file__).parent
+
+# Installed for scripts and optional features; must never load with the app.
+HEAVY_MODULES = ("pandas", "numpy", "boto3", "botocore", "emergentintegrations")
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+cli = typer.Typer(add_completion=False)
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    records = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return records
+
+
+def profile_import() -> List[ImportRecord]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import server"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing server failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def measure_ready(port: int, path: str, timeout: float = 60.0) -> float:
+    url = f"http://127.0.0.1:{port}{path}"
+    started = time.monotonic()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--port", str(port)],
+        cwd=ROOT_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=os.environ.copy(),
+    )
+    try:
+        while time.monotonic() - started < timeout:
+            try:
+                if requests.get(url, timeout=1).status_code == 200:
+                    return time.monotonic() - started
+            except requests.RequestException:
+                pass
+            time.sleep(0.02)
+        raise RuntimeError(f"Server did not answer {url} within {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+@cli.command()
+def main(
+    top: int = typer.Option(15, help="Number of slowest top-level imports to list"),
+    import_budget_ms: float = typer.Option(1000.0, help="Maximum time to import server.py"),
+    ready_budget_ms: float = typer.Option(3000.0, help="Maximum time from launch to first response"),
+    skip_ready: bool = typer.Option(False, help="Only profile the import, do not boot a server"),
+    port: int = typer.Option(8102, help="Port for the readiness check"),
+    path: str = typer.Option("/api/reviews/summary", help="Endpoint used as the first request"),
+):
+    records = profile_import()
+    failures = []
+
+    top_level = sorted((r for r in records if r.depth == 0), key=lambda r: r.cumulative_us, reverse=True)
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for record in top_level[:top]:
+        print(f"{record.cumulative_us / 1000:14.1f} {record.self_us / 1000:9.1f}  {record.module}")
+
+    server_record = next((r for r in records if r.module == "server"), None)
+    import_ms = server_record.cumulative_us / 1000 if server_record else 0.0
+    print(f"\nimport server: {import_ms:.1f} ms (budget {import_budget_ms:.0f} ms)")
+    if import_ms > import_budget_ms:
+        failures.append(f"import took {import_ms:.1f} ms")
+
+    loaded = {r.module.split(".")[0] for r in records}
+    heavy = sorted(loaded.intersection(HEAVY_MODULES))
+    if heavy:
+        failures.append(f"heavy modules imported eagerly: {', '.join(heavy)}")
+
+    if not skip_ready:
+        ready_ms = measure_ready(port, path) * 1000
+        print(f"first request ready: {ready_ms:.1f} ms (budget {ready_budget_ms:.0f} ms)")
+        if ready_ms > ready_budget_ms:
+            failures.append(f"first request took {ready_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    raise typer.Exit(code=1 if failures else 0)
+
+
+if __name__ == "__main__":
+    cli()
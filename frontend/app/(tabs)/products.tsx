@@ -11,7 +11,7 @@ import {
 } from 'react-native';
 import { Ionicons } from '@expo/vector-icons';
 import { useRouter } from 'expo-router';
-import { productsAPI } from '../../utils/api';
+import { loadCollection } from '../../utils/catalogStore';
 
 const categories = ['All', 'Makeup', 'Skincare', 'Fragrances', 'Haircare', 'Gift Items'];
 
@@ -34,9 +34,11 @@ export default function ProductsScreen() {
 
   const loadProducts = async () => {
     try {
-      const response = await productsAPI.getAll();
-      setProducts(response.data);
-      setFilteredProducts(response.data);
+      await loadCollection('products', (items) => {
+        setProducts(items);
+        setFilteredProducts(items);
+        setLoading(false);
+      });
     } catch (error) {
       console.error('Error loading products:', error);
     } finally {
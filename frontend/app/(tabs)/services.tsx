@@ -8,7 +8,7 @@ import {
   RefreshControl,
   Dimensions,
 } from 'react-native';
-import { servicesAPI } from '../../utils/api';
+import { loadCollection } from '../../utils/catalogStore';
 
 const { width } = Dimensions.get('window');
 
@@ -23,8 +23,10 @@ export default function ServicesScreen() {
 
   const loadServices = async () => {
     try {
-      const response = await servicesAPI.getAll();
-      setServices(response.data);
+      await loadCollection('services', (items) => {
+        setServices(items);
+        setLoading(false);
+      });
     } catch (error) {
       console.error('Error loading services:', error);
     } finally {
@@ -11,7 +11,7 @@ import {
   Modal,
 } from 'react-native';
 import { Ionicons } from '@expo/vector-icons';
-import { galleryAPI } from '../utils/api';
+import { loadCollection } from '../utils/catalogStore';
 
 const { width } = Dimensions.get('window');
 const imageSize = (width - 48) / 2;
@@ -29,8 +29,10 @@ export default function GalleryScreen() {
 
   const loadGallery = async () => {
     try {
-      const response = await galleryAPI.getAll();
-      setGallery(response.data);
+      await loadCollection('gallery', (items) => {
+        setGallery(items);
+        setLoading(false);
+      });
     } catch (error) {
       console.error('Error loading gallery:', error);
     } finally {
@@ -16,11 +16,13 @@ export default function ProductDetailScreen() {
   const router = useRouter();
   const { id } = useLocalSearchParams();
   const [product, setProduct] = useState<any>(null);
+  const [related, setRelated] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     if (id) {
       loadProduct();
+      loadRelated();
     }
   }, [id]);
 
@@ -35,6 +37,15 @@ export default function ProductDetailScreen() {
     }
   };
 
+  const loadRelated = async () => {
+    try {
+      const response = await productsAPI.getRelated(id as string);
+      setRelated(response.data);
+    } catch (error) {
+      setRelated([]);
+    }
+  };
+
   const contactForProduct = () => {
     const message = `Hi, I'm interested in ${product?.name}`;
     Linking.openURL(`https://wa.me/919876543210?text=${encodeURIComponent(message)}`);
@@ -118,6 +129,27 @@ export default function ProductDetailScreen() {
           <Ionicons name="logo-whatsapp" size={20} color="#FFF" />
           <Text style={styles.contactButtonText}>Contact Us for Purchase</Text>
         </TouchableOpacity>
+
+        {related.length > 0 && (
+          <View style={styles.relatedSection}>
+            <Text style={styles.sectionTitle}>You May Also Like</Text>
+            <ScrollView horizontal showsHorizontalScrollIndicator={false}>
+              {related.map((item) => (
+                <TouchableOpacity
+                  key={item.id}
+                  style={styles.relatedCard}
+                  onPress={() => router.push(`/product-detail?id=${item.id}`)}
+                >
+                  <Image source={{ uri: item.image }} style={styles.relatedImage} />
+                  <Text style={styles.relatedName} numberOfLines={2}>
+                    {item.name}
+                  </Text>
+                  <Text style={styles.relatedPrice}>₹{item.price}</Text>
+                </TouchableOpacity>
+              ))}
+            </ScrollView>
+          </View>
+        )}
       </View>
     </ScrollView>
   );
@@ -253,4 +285,31 @@ const styles = StyleSheet.create({
     fontWeight: '600',
     color: '#FFF',
   },
+  relatedSection: {
+    marginTop: 32,
+  },
+  relatedCard: {
+    width: 140,
+    marginRight: 12,
+    backgroundColor: '#FFF',
+    borderRadius: 12,
+    overflow: 'hidden',
+  },
+  relatedImage: {
+    width: '100%',
+    height: 120,
+    backgroundColor: '#F0F0F0',
+  },
+  relatedName: {
+    fontSize: 14,
+    color: '#333',
+    paddingHorizontal: 8,
+    paddingTop: 8,
+  },
+  relatedPrice: {
+    fontSize: 14,
+    fontWeight: 'bold',
+    color: '#D4AF37',
+    padding: 8,
+  },
 });
@@ -11,6 +11,7 @@ import {
 } from 'react-native';
 import { Ionicons } from '@expo/vector-icons';
 import { reviewsAPI } from '../utils/api';
+import { loadCollection } from '../utils/catalogStore';
 
 export default function ReviewsScreen() {
   const [reviews, setReviews] = useState<any[]>([]);
@@ -29,8 +30,10 @@ export default function ReviewsScreen() {
 
   const loadReviews = async () => {
     try {
-      const response = await reviewsAPI.getAll(true);
-      setReviews(response.data);
+      await loadCollection('reviews', (items) => {
+        setReviews(items);
+        setLoading(false);
+      });
     } catch (error) {
       console.error('Error loading reviews:', error);
     } finally {
@@ -22,6 +22,8 @@ export const productsAPI = {
     return api.get('/api/products', { params });
   },
   getById: (id: string) => api.get(`/api/products/${id}`),
+  getRelated: (id: string, limit?: number) =>
+    api.get(`/api/products/${id}/related`, { params: limit ? { limit } : {} }),
   create: (data: any) => api.post('/api/products', data),
   update: (id: string, data: any) => api.put(`/api/products/${id}`, data),
   delete: (id: string) => api.delete(`/api/products/${id}`),
@@ -31,12 +33,16 @@ export const bookingsAPI = {
   getAll: (status?: string) => api.get('/api/bookings', { params: status ? { status } : {} }),
   create: (data: any) => api.post('/api/bookings', data),
   updateStatus: (id: string, status: string) => api.put(`/api/bookings/${id}`, { status }),
+  getCalendar: (from: string, to: string, status?: string) =>
+    api.get('/api/bookings/calendar', { params: status ? { from, to, status } : { from, to } }),
 };
 
 export const reviewsAPI = {
   getAll: (approved?: boolean) => api.get('/api/reviews', { params: approved !== undefined ? { approved } : {} }),
   create: (data: any) => api.post('/api/reviews', data),
   approve: (id: string, approved: boolean) => api.put(`/api/reviews/${id}`, { approved }),
+  getSummary: () => api.get('/api/reviews/summary'),
+  rebuildSummary: () => api.post('/api/reviews/summary/rebuild'),
 };
 
 export const servicesAPI = {
@@ -52,6 +58,10 @@ export const galleryAPI = {
   delete: (id: string) => api.delete(`/api/gallery/${id}`),
 };
 
+export const syncAPI = {
+  get: (since?: string) => api.get('/api/sync', { params: since ? { since } : {} }),
+};
+
 export const adminAPI = {
   login: (username: string, password: string) => api.post('/api/admin/login', { username, password }),
 };
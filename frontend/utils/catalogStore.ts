@@ -0,0 +1,144 @@
+import AsyncStorage from '@react-native-async-storage/async-storage';
+import { syncAPI } from './api';
+
+// Each document is stored under its own key so no single row grows past the
+// platform's per-row read limit once a catalog holds many base64 images.
+const KEY_PREFIX = 'catalog:';
+const TOKEN_KEY = `${KEY_PREFIX}token`;
+const LEGACY_KEY = 'catalogStore';
+
+type Collection = 'products' | 'services' | 'gallery' | 'reviews';
+
+const COLLECTIONS: Collection[] = ['products', 'services', 'gallery', 'reviews'];
+const NEWEST_FIRST: Collection[] = ['gallery', 'reviews'];
+
+let inflight: Promise<CatalogStore> | null = null;
+let memory: CatalogStore | null = null;
+let saving: Promise<void> = Promise.resolve();
+
+export type CatalogStore = {
+  token?: string;
+  products: Record<string, any>;
+  services: Record<string, any>;
+  gallery: Record<string, any>;
+  reviews: Record<string, any>;
+};
+
+const emptyStore = (): CatalogStore => ({
+  products: {},
+  services: {},
+  gallery: {},
+  reviews: {},
+});
+
+const docKey = (collection: Collection, id: string) => `${KEY_PREFIX}${collection}:${id}`;
+
+const catalogKeys = async () =>
+  (await AsyncStorage.getAllKeys()).filter((key) => key.startsWith(KEY_PREFIX));
+
+export const loadCatalog = async (): Promise<CatalogStore> => {
+  if (memory) {
+    return memory;
+  }
+  try {
+    const store = emptyStore();
+    const rows = await AsyncStorage.multiGet(await catalogKeys());
+    rows.forEach(([key, raw]) => {
+      if (raw === null) {
+        return;
+      }
+      if (key === TOKEN_KEY) {
+        store.token = raw;
+        return;
+      }
+      const [collection, id] = key.slice(KEY_PREFIX.length).split(':');
+      if (COLLECTIONS.includes(collection as Collection)) {
+        store[collection as Collection][id] = JSON.parse(raw);
+      }
+    });
+    return store;
+  } catch (error) {
+    console.error('Error reading catalog store:', error);
+    return emptyStore();
+  }
+};
+
+// The token is written last, so a save cut short (storage full, app killed)
+// leaves the old token behind and the next sync simply fetches the changes
+// again.
+const persistDelta = async (delta: any) => {
+  if (delta.full) {
+    await AsyncStorage.multiRemove([...(await catalogKeys()), LEGACY_KEY]);
+  }
+  const changed: [string, string][] = [];
+  const removed: string[] = [];
+  COLLECTIONS.forEach((collection) => {
+    delta[collection].forEach((doc: any) => {
+      changed.push([docKey(collection, doc.id), JSON.stringify(doc)]);
+    });
+    delta.deleted[collection].forEach((id: string) => {
+      removed.push(docKey(collection, id));
+    });
+  });
+  await AsyncStorage.multiSet(changed);
+  await AsyncStorage.multiRemove(removed);
+  await AsyncStorage.setItem(TOKEN_KEY, delta.token);
+};
+
+// Fetch only what changed since the stored token and merge it into the local
+// copy. A full response (first launch or no token) replaces the store.
+// Screens mounting together share one request.
+export const syncCatalog = (): Promise<CatalogStore> => {
+  if (!inflight) {
+    inflight = applyDelta().finally(() => {
+      inflight = null;
+    });
+  }
+  return inflight;
+};
+
+const applyDelta = async (): Promise<CatalogStore> => {
+  const current = await loadCatalog();
+  const response = await syncAPI.get(current.token);
+  const delta = response.data;
+  const store = delta.full ? emptyStore() : current;
+
+  COLLECTIONS.forEach((collection) => {
+    delta[collection].forEach((doc: any) => {
+      store[collection][doc.id] = doc;
+    });
+    delta.deleted[collection].forEach((id: string) => {
+      delete store[collection][id];
+    });
+  });
+  store.token = delta.token;
+  memory = store;
+
+  // Screens get the merged store whether or not it can be saved
+  saving = saving
+    .then(() => persistDelta(delta))
+    .catch((error) => console.error('Error saving catalog store:', error));
+  return store;
+};
+
+export const listCollection = (store: CatalogStore, collection: Collection) => {
+  const items = Object.values(store[collection]);
+  if (NEWEST_FIRST.includes(collection)) {
+    items.sort((a, b) => (b.createdAt || '').localeCompare(a.createdAt || ''));
+  }
+  return items;
+};
+
+// Hand the stored copy to the screen straight away on a warm launch, then
+// again once the delta is applied. Rejects if the sync request fails.
+export const loadCollection = async (
+  collection: Collection,
+  onData: (items: any[]) => void,
+) => {
+  const cached = await loadCatalog();
+  if (cached.token) {
+    onData(listCollection(cached, collection));
+  }
+  const store = await syncCatalog();
+  onData(listCollection(store, collection));
+};
@@ -0,0 +1,106 @@
+"""
+Shared fixtures for the in-process backend test suite.
+
+Every test gets the FastAPI app, with its lifespan run, talking to its own
+in-memory Mongo stand-in. No state is shared between tests, so the suite can
+be spread across processes with ``pytest -n auto``.
+"""
+
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from mongomock_motor import AsyncMongoMockClient
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "test")
+
+import server  # noqa: E402
+
+# Each test, setup and teardown included, must finish within this many seconds
+TEST_BUDGET_SECONDS = float(os.environ.get("TEST_BUDGET_SECONDS", "2.0"))
+
+SAMPLE_IMAGE_B64 = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+
+
+@pytest.fixture(autouse=True)
+def runtime_budget(request):
+    started = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - started
+    if elapsed > TEST_BUDGET_SECONDS:
+        pytest.fail(f"{request.node.name} took {elapsed:.2f}s, budget is {TEST_BUDGET_SECONDS:.2f}s")
+
+
+@pytest_asyncio.fixture
+async def api(monkeypatch):
+    monkeypatch.setattr(server, "AsyncIOMotorClient", lambda url, **kwargs: AsyncMongoMockClient())
+    monkeypatch.setenv("DB_NAME", f"test_{uuid.uuid4().hex}")
+    async with server.lifespan(server.app):
+        transport = ASGITransport(app=server.app)
+        async with AsyncClient(transport=transport, base_url="http://test/api") as client:
+            yield client
+
+
+@pytest.fixture
+def product_data():
+    return {
+        "name": "Lakme Absolute Lipstick",
+        "description": "Long-lasting matte lipstick in vibrant red shade",
+        "price": 850.0,
+        "category": "Makeup",
+        "image": SAMPLE_IMAGE_B64,
+        "inStock": True,
+        "featured": True
+    }
+
+
+@pytest.fixture
+def booking_data():
+    return {
+        "name": "Priya Sharma",
+        "phone": "+91-9876543210",
+        "email": "priya.sharma@email.com",
+        "service": "Bridal Makeup",
+        "date": "2024-02-15",
+        "time": "10:00 AM",
+        "message": "Need bridal makeup for morning ceremony",
+        "status": "pending"
+    }
+
+
+@pytest.fixture
+def review_data():
+    return {
+        "name": "Anjali Verma",
+        "rating": 5,
+        "comment": "Excellent service! The makeup artist was very professional.",
+        "approved": False
+    }
+
+
+@pytest.fixture
+def service_data():
+    return {
+        "name": "Hair Styling & Makeup",
+        "description": "Complete hair styling and makeup package for special occasions",
+        "duration": "2 hours",
+        "price": 3500.0,
+        "image": SAMPLE_IMAGE_B64,
+        "popular": True
+    }
+
+
+@pytest.fixture
+def gallery_data():
+    return {
+        "image": SAMPLE_IMAGE_B64,
+        "caption": "Beautiful bridal makeup transformation by our expert team"
+    }
@@ -0,0 +1,354 @@
+"""
+Backend API tests for Shri Radhe Beauty & Gift Collection, run in-process
+against the ASGI app with an in-memory Mongo stand-in.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+import server
+
+pytestmark = pytest.mark.asyncio
+
+
+# ============= Products =============
+
+async def test_products_crud(api, product_data):
+    response = await api.get("/products")
+    assert response.status_code == 200
+    assert response.json() == []
+
+    response = await api.post("/products", json=product_data)
+    assert response.status_code == 200
+    product_id = response.json()["id"]
+
+    response = await api.get(f"/products/{product_id}")
+    assert response.status_code == 200
+    assert response.json()["name"] == product_data["name"]
+
+    update = {**product_data, "name": "Lakme Absolute Lipstick - Updated", "price": 950.0}
+    response = await api.put(f"/products/{product_id}", json=update)
+    assert response.status_code == 200
+    assert response.json()["name"] == update["name"]
+    assert response.json()["updatedAt"]
+
+    response = await api.delete(f"/products/{product_id}")
+    assert response.status_code == 200
+    assert (await api.get("/products")).json() == []
+
+
+async def test_products_filters(api, product_data):
+    await api.post("/products", json=product_data)
+    await api.post("/products", json={**product_data, "category": "Skincare", "featured": False})
+
+    makeup = (await api.get("/products", params={"category": "Makeup"})).json()
+    featured = (await api.get("/products", params={"featured": "true"})).json()
+    assert [p["category"] for p in makeup] == ["Makeup"]
+    assert [p["featured"] for p in featured] == [True]
+
+
+async def test_product_not_found(api):
+    response = await api.delete("/products/000000000000000000000000")
+    assert response.status_code == 404
+    assert (await api.get("/products/not-an-id")).status_code == 400
+
+
+# ============= Bookings =============
+
+async def test_bookings_create_and_update(api, booking_data):
+    response = await api.post("/bookings", json=booking_data)
+    assert response.status_code == 200
+    booking = response.json()
+    assert booking["appointmentAt"].startswith("2024-02-15T04:30")
+
+    response = await api.put(f"/bookings/{booking['id']}", json={"status": "confirmed"})
+    assert response.status_code == 200
+    assert response.json()["status"] == "confirmed"
+
+    confirmed = (await api.get("/bookings", params={"status": "confirmed"})).json()
+    assert [b["id"] for b in confirmed] == [booking["id"]]
+
+
+async def test_booking_calendar(api, booking_data):
+    await api.post("/bookings", json=booking_data)
+    await api.post("/bookings", json={**booking_data, "date": "16/02/2024", "time": "2:30 PM"})
+    await api.post("/bookings", json={**booking_data, "date": "next week"})
+
+    response = await api.get("/bookings/calendar", params={"from": "2024-02-15", "to": "2024-02-16"})
+    assert response.status_code == 200
+    days = response.json()
+    assert [d["date"] for d in days] == ["2024-02-15", "2024-02-16"]
+    assert days[1]["bookings"][0]["appointmentAt"] == "2024-02-16T14:30:00+05:30"
+
+    response = await api.get("/bookings/calendar", params={"from": "2024-02-16", "to": "2024-02-15"})
+    assert response.status_code == 400
+
+
+async def test_booking_calendar_migration(api, monkeypatch, booking_data):
+    monkeypatch.setattr(server, "MIGRATION_BATCH", 2)
+    legacy = [
+        {**booking_data, "date": "15/02/2024", "time": "11:00 AM"},
+        {**booking_data, "date": "2024-02-15", "time": "4 PM"},
+        {**booking_data, "date": "16-02-2024", "time": "09:15"},
+        {**booking_data, "date": "sometime", "time": "10:00 AM"},
+    ]
+    await server.db.bookings.insert_many(legacy)
+
+    response = await api.post("/bookings/calendar/migrate")
+    assert response.json() == {"updated": 3, "unparsed": 1}
+    assert await server.db.bookings.count_documents({"appointmentAt": {"$exists": False}}) == 0
+
+    days = (await api.get("/bookings/calendar", params={"from": "2024-02-15", "to": "2024-02-16"})).json()
+    assert [len(d["bookings"]) for d in days] == [2, 1]
+    assert days[0]["bookings"][1]["appointmentAt"] == "2024-02-15T16:00:00+05:30"
+
+    assert (await api.post("/bookings/calendar/migrate")).json() == {"updated": 0, "unparsed": 0}
+
+
+# ============= Reviews =============
+
+async def test_reviews_create_and_approve(api, review_data):
+    response = await api.post("/reviews", json=review_data)
+    assert response.status_code == 200
+    review_id = response.json()["id"]
+
+    response = await api.put(f"/reviews/{review_id}", json={"approved": True})
+    assert response.status_code == 200
+    assert response.json()["approved"] is True
+
+    approved = (await api.get("/reviews", params={"approved": "true"})).json()
+    assert [r["id"] for r in approved] == [review_id]
+
+
+async def test_review_rating_is_validated(api, review_data):
+    response = await api.post("/reviews", json={**review_data, "rating": 6})
+    assert response.status_code == 422
+
+
+async def test_review_summary(api, review_data):
+    await api.post("/reviews", json={**review_data, "rating": 5, "approved": True})
+    await api.post("/reviews", json={**review_data, "rating": 3, "approved": True})
+    pending = (await api.post("/reviews", json={**review_data, "rating": 1})).json()
+
+    summary = (await api.get("/reviews/summary")).json()
+    assert summary["count"] == 2
+    assert summary["average"] == 4.0
+    assert summary["histogram"] == {"1": 0, "2": 0, "3": 1, "4": 0, "5": 1}
+
+    await api.put(f"/reviews/{pending['id']}", json={"approved": True})
+    await api.put(f"/reviews/{pending['id']}", json={"approved": True})
+    summary = (await api.get("/reviews/summary")).json()
+    assert summary["count"] == 3
+    assert summary["histogram"]["1"] == 1
+
+    rebuilt = (await api.post("/reviews/summary/rebuild")).json()
+    assert rebuilt == summary
+
+
+async def test_review_summary_rebuild_keeps_concurrent_increments(api, monkeypatch, review_data):
+    await api.post("/reviews", json={**review_data, "approved": True})
+    collection_type = type(server.db.reviews)
+    aggregate = collection_type.aggregate
+    raced = []
+
+    async def aggregate_then_approve(self, pipeline):
+        async for row in aggregate(self, pipeline):
+            yield row
+        # A review approved after the aggregate has read, before the write
+        if not raced:
+            raced.append(True)
+            async with server.review_summary_write(server.db) as changes:
+                await server.db.reviews.insert_one({**review_data, "rating": 2, "approved": True})
+                changes.append((2, 1))
+
+    monkeypatch.setattr(collection_type, "aggregate", aggregate_then_approve)
+    await server.rebuild_review_summary(server.db)
+
+    summary = (await api.get("/reviews/summary")).json()
+    assert summary["count"] == 2
+    assert summary["histogram"]["2"] == 1
+
+
+async def test_review_summary_rebuild_waits_for_inflight_writes(api, monkeypatch, review_data):
+    await api.post("/reviews", json={**review_data, "approved": True})
+    pending = (await api.post("/reviews", json={**review_data, "rating": 2})).json()
+    collection_type = type(server.db.reviews)
+    aggregate = collection_type.aggregate
+    flipped = asyncio.Event()
+    writers = []
+
+    async def approve_slowly():
+        # Review flipped before the aggregate reads, $inc after the rebuild writes
+        async with server.review_summary_write(server.db) as changes:
+            await server.db.reviews.update_one({"_id": ObjectId(pending["id"])}, {"$set": {"approved": True}})
+            changes.append((2, 1))
+            flipped.set()
+            await asyncio.sleep(0.1)
+
+    async def aggregate_after_approval(self, pipeline):
+        if not writers:
+            writers.append(asyncio.create_task(approve_slowly()))
+            await flipped.wait()
+        async for row in aggregate(self, pipeline):
+            yield row
+
+    monkeypatch.setattr(collection_type, "aggregate", aggregate_after_approval)
+    await server.rebuild_review_summary(server.db)
+    await writers[0]
+
+    summary = (await api.get("/reviews/summary")).json()
+    assert summary["count"] == 2
+    assert summary["histogram"]["2"] == 1
+
+
+# ============= Services =============
+
+async def test_services_crud(api, service_data):
+    response = await api.post("/services", json=service_data)
+    assert response.status_code == 200
+    service_id = response.json()["id"]
+
+    update = {**service_data, "name": "Hair Styling & Makeup - Premium", "price": 4000.0}
+    response = await api.put(f"/services/{service_id}", json=update)
+    assert response.status_code == 200
+    assert response.json()["price"] == 4000.0
+
+    assert len((await api.get("/services")).json()) == 1
+    assert (await api.delete(f"/services/{service_id}")).status_code == 200
+    assert (await api.get("/services")).json() == []
+    assert (await api.delete(f"/services/{service_id}")).status_code == 404
+
+
+# ============= Gallery =============
+
+async def test_gallery_add_and_delete(api, gallery_data):
+    response = await api.post("/gallery", json=gallery_data)
+    assert response.status_code == 200
+    item_id = response.json()["id"]
+
+    assert [i["id"] for i in (await api.get("/gallery")).json()] == [item_id]
+    assert (await api.delete(f"/gallery/{item_id}")).status_code == 200
+    assert (await api.get("/gallery")).json() == []
+
+
+# ============= Sync =============
+
+async def test_sync_returns_changes_and_deletions(api, product_data, service_data):
+    kept = (await api.post("/products", json=product_data)).json()
+    dropped = (await api.post("/products", json=product_data)).json()
+
+    full = (await api.get("/sync")).json()
+    assert full["full"] is True
+    assert {p["id"] for p in full["products"]} == {kept["id"], dropped["id"]}
+
+    await api.delete(f"/products/{dropped['id']}")
+    await api.post("/services", json=service_data)
+    delta = (await api.get("/sync", params={"since": full["token"]})).json()
+    assert delta["full"] is False
+    assert delta["deleted"]["products"] == [dropped["id"]]
+    assert len(delta["services"]) == 1
+
+    assert (await api.get("/sync", params={"since": "yesterday"})).status_code == 400
+
+
+async def test_sync_only_publishes_approved_reviews(api, review_data):
+    pending = (await api.post("/reviews", json=review_data)).json()
+    approved = (await api.post("/reviews", json={**review_data, "approved": True})).json()
+
+    full = (await api.get("/sync")).json()
+    assert [r["id"] for r in full["reviews"]] == [approved["id"]]
+
+    delta = (await api.get("/sync", params={"since": full["token"]})).json()
+    assert pending["id"] not in [r["id"] for r in delta["reviews"]]
+
+    await api.put(f"/reviews/{approved['id']}", json={"approved": False})
+    delta = (await api.get("/sync", params={"since": full["token"]})).json()
+    assert delta["reviews"] == []
+    assert approved["id"] in delta["deleted"]["reviews"]
+
+
+async def test_sync_falls_back_to_full_after_retention(api, product_data):
+    await api.post("/products", json=product_data)
+    stale = server.encode_sync_token(datetime.utcnow() - server.SOFT_DELETE_RETENTION - timedelta(days=1))
+
+    response = (await api.get("/sync", params={"since": stale})).json()
+    assert response["full"] is True
+    assert len(response["products"]) == 1
+
+
+# ============= Soft delete and compaction =============
+
+async def test_deleted_documents_are_hidden(api, product_data):
+    product = (await api.post("/products", json=product_data)).json()
+    await api.delete(f"/products/{product['id']}")
+
+    assert (await api.get(f"/products/{product['id']}")).status_code == 404
+    assert (await api.put(f"/products/{product['id']}", json=product_data)).status_code == 404
+    assert (await api.delete(f"/products/{product['id']}")).status_code == 404
+    assert await server.db.products.count_documents({"deleted": True}) == 1
+
+
+async def test_compaction_purges_only_expired_tombstones(api, monkeypatch, product_data, gallery_data):
+    monkeypatch.setattr(server, "COMPACTION_BATCH", 2)
+    monkeypatch.setattr(server, "COMPACTION_PAUSE_SECONDS", 0)
+    ids = [(await api.post("/products", json=product_data)).json()["id"] for _ in range(5)]
+    live = (await api.post("/products", json=product_data)).json()["id"]
+    item = (await api.post("/gallery", json=gallery_data)).json()["id"]
+    for product_id in ids:
+        await api.delete(f"/products/{product_id}")
+    await api.delete(f"/gallery/{item}")
+
+    assert await server.compact_deleted() == {"products": 0, "services": 0, "gallery": 0}
+
+    later = datetime.utcnow() + server.SOFT_DELETE_RETENTION + timedelta(seconds=1)
+    assert await server.compact_deleted(now=later) == {"products": 5, "services": 0, "gallery": 1}
+    remaining = [str(p["_id"]) async for p in server.db.products.find()]
+    assert remaining == [live]
+
+
+# ============= Related products =============
+
+async def test_related_products(api, product_data):
+    # The index is built in the background after startup
+    while server.related_index is None:
+        await asyncio.sleep(0.01)
+    base = (await api.post("/products", json=product_data)).json()
+    similar = (await api.post("/products", json={**product_data, "name": "Lakme Matte Lipstick"})).json()
+    await api.post("/products", json={
+        **product_data,
+        "name": "Engage Perfume Gift Set",
+        "description": "Premium fragrance gift set",
+        "category": "Gift Items",
+        "price": 1299.0
+    })
+
+    related = (await api.get(f"/products/{base['id']}/related", params={"limit": 2})).json()
+    assert related[0]["id"] == similar["id"]
+
+    await api.delete(f"/products/{similar['id']}")
+    related = (await api.get(f"/products/{base['id']}/related")).json()
+    assert similar["id"] not in [p["id"] for p in related]
+
+    response = await api.get(f"/products/{similar['id']}/related")
+    assert response.status_code == 404
+
+
+# ============= Admin =============
+
+async def test_admin_login(api):
+    response = await api.post("/admin/login", json={"username": "admin", "password": "admin123"})
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    assert response.json()["token"]
+
+    response = await api.post("/admin/login", json={"username": "admin", "password": "wrongpassword"})
+    assert response.status_code == 401
+
+
+async def test_seed_data(api):
+    assert (await api.post("/seed-data")).json() == {"message": "Data seeded successfully"}
+    assert (await api.post("/seed-data")).json() == {"message": "Data already seeded"}
+    assert (await api.get("/reviews/summary")).json()["count"] == 3
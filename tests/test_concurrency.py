@@ -0,0 +1,64 @@
+"""
+Race tests: many identical or conflicting requests issued at once.
+"""
+
+import asyncio
+
+import pytest
+
+import server
+
+pytestmark = pytest.mark.asyncio
+
+CONCURRENCY = 50
+
+
+async def test_concurrent_booking_status_updates(api, booking_data):
+    booking = (await api.post("/bookings", json=booking_data)).json()
+    statuses = ["confirmed", "completed", "cancelled"] * (CONCURRENCY // 3)
+
+    responses = await asyncio.gather(*(
+        api.put(f"/bookings/{booking['id']}", json={"status": s}) for s in statuses
+    ))
+    assert all(r.status_code == 200 for r in responses)
+    assert all(r.json()["status"] in statuses for r in responses)
+
+    stored = (await api.get("/bookings")).json()
+    assert len(stored) == 1
+    assert stored[0]["status"] in statuses
+
+
+async def test_concurrent_review_approvals_count_once(api, review_data):
+    review = (await api.post("/reviews", json=review_data)).json()
+
+    responses = await asyncio.gather(*(
+        api.put(f"/reviews/{review['id']}", json={"approved": True}) for _ in range(CONCURRENCY)
+    ))
+    assert all(r.status_code == 200 for r in responses)
+
+    summary = (await api.get("/reviews/summary")).json()
+    assert summary["count"] == 1
+    assert summary["histogram"]["5"] == 1
+
+
+async def test_concurrent_catalog_reads_are_coalesced(api, product_data):
+    await api.post("/products", json=product_data)
+    before_executed = server.catalog_flight.executed
+    before = before_executed + server.catalog_flight.coalesced
+
+    responses = await asyncio.gather(*(
+        api.get("/products", params={"featured": "true"}) for _ in range(CONCURRENCY)
+    ))
+    assert len({r.content for r in responses}) == 1
+
+    stats = (await api.get("/admin/perf/coalescing")).json()
+    assert stats["executed"] + stats["coalesced"] - before == CONCURRENCY
+    assert stats["executed"] - before_executed == 1
+    assert stats["inflight"] == 0
+
+
+async def test_concurrent_booking_creation(api, booking_data):
+    responses = await asyncio.gather(*(
+        api.post("/bookings", json={**booking_data, "name": f"Customer {i}"}) for i in range(CONCURRENCY)
+    ))
+    assert len({r.json()["id"] for r in responses}) == CONCURRENCY
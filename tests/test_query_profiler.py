@@ -0,0 +1,110 @@
+"""
+Unit tests for the query-shape profiler, driven with synthetic command events.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from query_profiler import QueryProfiler, command_shape
+
+
+def run_command(profiler, request_id, name, command, duration_ms, failed=False):
+    started = SimpleNamespace(command_name=name, command=command, request_id=request_id,
+                              connection_id=("localhost", 27017), database_name="test")
+    finished = SimpleNamespace(command_name=name, request_id=request_id,
+                               connection_id=("localhost", 27017), duration_micros=int(duration_ms * 1000))
+    profiler.started(started)
+    (profiler.failed if failed else profiler.succeeded)(finished)
+
+
+def test_shape_ignores_literal_values():
+    a = command_shape("find", {"find": "products", "filter": {"category": "Makeup", "deleted": False}})
+    b = command_shape("find", {"find": "products", "filter": {"deleted": False, "category": "Skincare"}})
+    c = command_shape("find", {"find": "products", "filter": {"featured": True, "deleted": False}})
+    assert a == b
+    assert a != c
+    assert "Makeup" not in a
+
+
+def test_shape_of_updates_and_pipelines():
+    update = command_shape("update", {"update": "bookings", "updates": [{"q": {"_id": 1}, "u": {"$set": {"status": "x"}}}]})
+    assert update == 'update bookings {"q":[{"_id":"?"}]}'
+
+    pipeline = command_shape("aggregate", {"aggregate": "reviews", "pipeline": [
+        {"$match": {"approved": True}},
+        {"$group": {"_id": "$rating", "n": {"$sum": 1}}}
+    ]})
+    assert '"$match":{"approved":"?"}' in pipeline
+    assert "$group" in pipeline
+
+
+def test_percentiles_and_memory_bounds(monkeypatch):
+    monkeypatch.setattr("query_profiler.MAX_SHAPES", 3)
+    profiler = QueryProfiler(slow_ms=50)
+
+    for i in range(100):
+        run_command(profiler, i, "find", {"find": "products", "filter": {"featured": True}}, duration_ms=i + 1)
+    run_command(profiler, 1000, "find", {"find": "products", "filter": {"featured": True}}, 5, failed=True)
+
+    stats = profiler.snapshot()[0]
+    assert stats["count"] == 101
+    assert stats["failures"] == 1
+    assert stats["maxMs"] == 100
+    assert 45 <= stats["p50Ms"] <= 55
+    assert stats["p99Ms"] >= 99
+    assert len(stats["slowSamples"]) == 5
+
+    for i, collection in enumerate(["services", "gallery", "reviews", "bookings"]):
+        run_command(profiler, 2000 + i, "find", {"find": collection, "filter": {}}, 1)
+    assert [s["collection"] for s in profiler.snapshot()] == ["gallery", "reviews", "bookings"]
+
+
+def test_ignores_driver_and_explain_commands():
+    profiler = QueryProfiler()
+    run_command(profiler, 1, "ping", {"ping": 1}, 1)
+    run_command(profiler, 2, "explain", {"explain": {"find": "products"}}, 1)
+    assert profiler.snapshot() == []
+
+
+@pytest.mark.asyncio
+async def test_slow_commands_are_explained():
+    explained = []
+
+    class FakeDatabase:
+        def __init__(self):
+            self.client = {"test": self}
+
+        async def command(self, command):
+            explained.append(command)
+            return {"queryPlanner": {"winningPlan": {"stage": "COLLSCAN", "filter": {"status": {"$eq": "pending"}}}}}
+
+    profiler = QueryProfiler(slow_ms=10)
+    profiler.attach(asyncio.get_running_loop(), FakeDatabase())
+    command = {"find": "bookings", "filter": {"status": "pending"}, "lsid": {"id": "x"}, "$db": "test"}
+    run_command(profiler, 1, "find", command, 50)
+    run_command(profiler, 2, "find", command, 50)
+    await asyncio.sleep(0)
+    assert len(profiler.tasks) == 1
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert not profiler.tasks
+
+    assert explained == [{"explain": {"find": "bookings", "filter": {"status": "pending"}}, "verbosity": "queryPlanner"}]
+    assert profiler.snapshot()[0]["plan"] == {"stage": "COLLSCAN", "filter": {"status": {"$eq": "?"}}}
+
+
+def test_slow_samples_hold_no_literal_values():
+    profiler = QueryProfiler(slow_ms=10)
+    booking = {"customerName": "Asha Verma", "phone": "9876543210", "email": "asha@example.com"}
+    run_command(profiler, 1, "insert", {"insert": "bookings", "documents": [booking]}, 50)
+    run_command(profiler, 2, "update", {"update": "bookings", "updates": [
+        {"q": {"phone": "9876543210"}, "u": {"$set": {"email": "asha@example.com"}}}
+    ]}, 50)
+
+    text = json.dumps(profiler.snapshot(), default=str)
+    for value in booking.values():
+        assert value not in text
+    assert all(set(s) == {"durationMs", "at"} for stats in profiler.snapshot() for s in stats["slowSamples"])
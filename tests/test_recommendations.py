@@ -0,0 +1,58 @@
+"""
+Unit tests for the related-products index: incremental writes must leave the
+same neighbour lists a full rebuild would.
+"""
+
+import random
+
+from recommendations import RelatedProductsIndex
+
+WORDS = ["matte", "lipstick", "serum", "glow", "cream", "gift", "set", "perfume", "kajal", "oil"]
+CATEGORIES = ["Makeup", "Skincare", "Gift Items", "Hair Care"]
+
+
+def make_products(n, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"p{i}",
+            "name": " ".join(rng.sample(WORDS, 2)),
+            "description": " ".join(rng.sample(WORDS, 3)),
+            "category": rng.choice(CATEGORIES),
+            "price": rng.choice([99.0, 249.0, 599.0, 1299.0]),
+        }
+        for i in range(n)
+    ]
+
+
+def assert_matches_rebuild(index):
+    fresh = RelatedProductsIndex(top_k=index.top_k)
+    fresh.vocab, fresh.idf = index.vocab, index.idf
+    fresh.ids = list(index.ids)
+    fresh.rows = dict(index.rows)
+    fresh.matrix = index.matrix
+    fresh.neighbours = {}
+    fresh.recompute(fresh.neighbours, fresh.ids)
+    for pid in index.ids:
+        got = [round(score, 5) for score, _ in index.neighbours[pid]]
+        want = [round(score, 5) for score, _ in fresh.neighbours[pid]]
+        assert got == want, pid
+
+
+def test_remove_refills_neighbour_lists():
+    index = RelatedProductsIndex(top_k=5)
+    index.build(make_products(40))
+    for pid in ["p3", "p17", "p29"]:
+        index.remove(pid)
+    assert all(len(entries) == 5 for entries in index.neighbours.values())
+    assert_matches_rebuild(index)
+
+
+def test_upsert_that_lowers_similarity_refills_lists():
+    products = make_products(40)
+    index = RelatedProductsIndex(top_k=5)
+    index.build(products)
+    # Turn a product into something unlike anything else
+    index.apply(upserts=[{**products[0], "name": "zz", "description": "", "category": "Other", "price": 99999.0}])
+    assert all(len(entries) == 5 for entries in index.neighbours.values())
+    assert_matches_rebuild(index)